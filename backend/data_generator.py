@@ -3,18 +3,28 @@ Data Generator - Creates realistic test data for the Blobs Platform
 Generates 10K individuals, major tech companies (as Aggregated/Blobs), 
 independent blobs, and projects.
 """
+import os
 import random
-import uuid
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Iterator, Optional
 from datetime import datetime, timedelta
+from collections import defaultdict
+from itertools import chain
 import math
 
+import numpy as np
+
 from models import (
     NodeType, EdgeType, BlobType, ProjectStatus, ProjectType,
     Individual, Blob, Aggregated, Project, Skill, Edge
 )
 from graph_engine import GraphEngine
 
+try:
+    # Optional: JIT-compile the peer kernel when numba is installed
+    from numba import njit
+except ImportError:
+    njit = None
+
 
 # ============================================
 # Data Constants
@@ -76,6 +86,9 @@ BUSINESS_SKILLS = [
     "Negotiation", "Presentation", "Team Building", "Mentoring", "Consulting"
 ]
 
+# O(1) membership tests instead of scanning the skill lists
+TECH_SKILLS_SET = frozenset(TECH_SKILLS)
+
 SECTORS = [
     "Technology", "Finance", "Healthcare", "Education", "E-commerce", "Media",
     "Energy", "Transportation", "Manufacturing", "Real Estate", "Consulting",
@@ -196,11 +209,179 @@ PROJECT_TEMPLATES = [
 ]
 
 
+def _batch_ids(n: int) -> List[str]:
+    """
+    Draw n unique hex IDs from a single urandom call.
+    Much cheaper than n individual uuid4() invocations.
+    """
+    buf = os.urandom(16 * n)
+    return [buf[i * 16:(i + 1) * 16].hex() for i in range(n)]
+
+
+def _id_stream(chunk: int = 8192) -> Iterator[str]:
+    """Endless stream of IDs, refilled in bulk for loops of unknown length"""
+    while True:
+        for _id in _batch_ids(chunk):
+            yield _id
+
+
+def _build_individual_chunk(seed_seq: np.random.SeedSequence, count: int,
+                            created_at: str) -> List[dict]:
+    """
+    Build `count` Individual node dicts.
+    Free function so chunks can be generated in worker processes and
+    merged by the caller; the per-worker rng is seeded for reproducible
+    splits.
+    """
+    rng = np.random.default_rng(seed_seq)
+    ids = _batch_ids(count)
+    nt_individual = NodeType.INDIVIDUAL.value
+
+    # Draw all attributes up front in a few C-level calls instead of
+    # 6+ Python random calls per individual
+    first_idx = rng.integers(0, len(FIRST_NAMES), count)
+    last_idx = rng.integers(0, len(LAST_NAMES), count)
+    loc_idx = rng.integers(0, len(LOCATIONS), count)
+    sector_idx = rng.integers(0, len(SECTORS), count)
+    available = rng.random(count) > 0.3  # 70% available
+
+    # Skills: 2-8 per person, biased towards tech
+    num_skills = rng.integers(2, 9, count)
+    tech_counts = rng.integers(1, num_skills + 1)
+    tech_idx = rng.integers(0, len(TECH_SKILLS), (count, 8))
+    business_idx = rng.integers(0, len(BUSINESS_SKILLS), (count, 8))
+    levels = rng.integers(2, 6, (count, 8))  # proficiency 2-5
+
+    batch = []
+    for i in range(count):
+        if i % 1000 == 0:
+            print(f"  Generated {i}/{count} individuals...")
+
+        n_tech = tech_counts[i]
+        n_business = num_skills[i] - n_tech
+
+        # Dedupe per row while preserving draw order
+        skills = list(dict.fromkeys(TECH_SKILLS[j] for j in tech_idx[i, :n_tech]))
+        if n_business > 0:
+            seen = set(skills)
+            skills += [s for s in (BUSINESS_SKILLS[j] for j in business_idx[i, :n_business])
+                       if s not in seen]
+
+        # Skill levels (1-5)
+        skill_levels = {s: int(lvl) for s, lvl in zip(skills, levels[i])}
+
+        batch.append({
+            'id': ids[i],
+            'name': f"{FIRST_NAMES[first_idx[i]]} {LAST_NAMES[last_idx[i]]}",
+            'node_type': nt_individual,
+            'skills': skills,
+            'skill_levels': skill_levels,
+            'availability': bool(available[i]),
+            'location': LOCATIONS[loc_idx[i]],
+            'sector': SECTORS[sector_idx[i]],
+            'bio': f"Professional with expertise in {', '.join(skills[:3])}",
+            'blob_memberships': [],
+            'created_at': created_at
+        })
+    return batch
+
+
+def _peer_edge_kernel(ind_blob_indptr, ind_blob_indices,
+                      blob_indptr, blob_indices,
+                      num_peers, k_local, u, n):
+    """
+    Draw peer edges as (src, dst) index arrays over CSR adjacency.
+    Pure integer/array arithmetic so numba can compile it in nopython
+    mode; without numba it still runs as a plain Python loop. All
+    randomness comes in via u (one uniform [0,1) variate per draw, from
+    the caller's seeded generator) so seeded runs are reproducible
+    regardless of whether the kernel is JIT-compiled.
+    """
+    total = 0
+    for i in range(n):
+        total += num_peers[i]
+    src = np.empty(total, np.int64)
+    dst = np.empty(total, np.int64)
+    out = 0
+    t = 0
+
+    for i in range(n):
+        # Size of this individual's shared-blob candidate pool
+        pool = 0
+        for b in range(ind_blob_indptr[i], ind_blob_indptr[i + 1]):
+            blob = ind_blob_indices[b]
+            pool += blob_indptr[blob + 1] - blob_indptr[blob]
+
+        k = num_peers[i]
+        kl = k_local[i] if pool > 0 else 0
+
+        for d in range(k):
+            peer = i
+            if d < kl:
+                # Uniform draw over the concatenation of the member
+                # lists of this individual's blobs
+                r = min(int(u[t] * pool), pool - 1)
+                for b in range(ind_blob_indptr[i], ind_blob_indptr[i + 1]):
+                    blob = ind_blob_indices[b]
+                    size = blob_indptr[blob + 1] - blob_indptr[blob]
+                    if r < size:
+                        peer = blob_indices[blob_indptr[blob] + r]
+                        break
+                    r -= size
+            else:
+                peer = min(int(u[t] * n), n - 1)
+            t += 1
+
+            if peer != i:
+                src[out] = i
+                dst[out] = peer
+                out += 1
+
+    return src[:out], dst[:out]
+
+
+if njit is not None:
+    _peer_edge_kernel = njit(cache=True)(_peer_edge_kernel)
+
+
 class DataGenerator:
     """Generates realistic test data for the Blobs platform"""
-    
-    def __init__(self, graph_engine: GraphEngine):
+
+    # Enum .value strings cached once; the hot loops write these
+    # constants instead of going through the Enum descriptor per item
+    _NT_INDIVIDUAL = NodeType.INDIVIDUAL.value
+    _NT_BLOB = NodeType.BLOB.value
+    _NT_AGGREGATED = NodeType.AGGREGATED.value
+    _NT_PROJECT = NodeType.PROJECT.value
+    _NT_SKILL = NodeType.SKILL.value
+    _BT_COMPANY = BlobType.COMPANY.value
+    _BT_INTERNAL = BlobType.INTERNAL.value
+    _BT_INDEPENDENT = BlobType.INDEPENDENT.value
+    _ET_MEMBER_OF = EdgeType.MEMBER_OF.value
+    _ET_WORKS_ON = EdgeType.WORKS_ON.value
+    _ET_EXECUTES = EdgeType.EXECUTES.value
+    _ET_COLLABORATES = EdgeType.COLLABORATES.value
+    _ET_CONTAINS = EdgeType.CONTAINS.value
+    _ET_PEER = EdgeType.PEER.value
+
+    def __init__(self, graph_engine: GraphEngine, seed: Optional[int] = None):
         self.engine = graph_engine
+        # Instance-local RNGs: reproducible datasets when seeded, and
+        # no module-global attribute lookups in the hot loops
+        self.rng = random.Random(seed)
+        self.np_rng = np.random.default_rng(seed)
+        self._seed_seq = np.random.SeedSequence(seed)
+        self._ids = _id_stream()
+        # Shared created_at stamp; all nodes/edges of one run carry the
+        # same string, so format it once instead of ~160k times
+        self._now = datetime.utcnow().isoformat()
+        # Inverted index skill -> individual ids, filled during
+        # individual generation and used for project matching
+        self._skill_index: Dict[str, List[str]] = defaultdict(list)
+        # blob id -> member indices into generated_ids['individuals'],
+        # filled during blob assignment and used for biased peer
+        # sampling (dense ints so the peer CSR build skips id mapping)
+        self._blob_members: Dict[str, List[int]] = defaultdict(list)
         self.generated_ids = {
             'individuals': [],
             'blobs': [],
@@ -217,6 +398,7 @@ class DataGenerator:
     ):
         """Generate complete test dataset"""
         print(f"Generating {num_individuals} individuals...")
+        self._now = datetime.utcnow().isoformat()
         
         # 1. Create Skill nodes
         self._generate_skills()
@@ -243,14 +425,12 @@ class DataGenerator:
         self._generate_relationships()
         
         # 9. Compute layout (skip for fast startup, use random positions)
-        import os
         if os.environ.get("SKIP_LAYOUT"):
             print("Skipping layout computation (SKIP_LAYOUT=true)")
             # Use random positions
-            import random
             for node_id in self.engine.node_data:
-                self.engine.node_data[node_id]['x'] = random.uniform(0, 1000)
-                self.engine.node_data[node_id]['y'] = random.uniform(0, 1000)
+                self.engine.node_data[node_id]['x'] = self.rng.uniform(0, 1000)
+                self.engine.node_data[node_id]['y'] = self.rng.uniform(0, 1000)
         else:
             print("Computing graph layout...")
             self.engine.compute_layout(scale=1000.0)
@@ -264,194 +444,193 @@ class DataGenerator:
     
     def _generate_skills(self):
         """Create Skill nodes"""
-        all_skills = list(set(TECH_SKILLS + BUSINESS_SKILLS))
-        
+        # Order-preserving dedupe; set() order varies with string-hash
+        # randomization and would reorder skill creation across runs
+        all_skills = list(dict.fromkeys(TECH_SKILLS + BUSINESS_SKILLS))
+
+        batch = []
         for skill_name in all_skills:
-            skill_id = str(uuid.uuid4())
-            skill_data = {
+            skill_id = next(self._ids)
+            batch.append({
                 'id': skill_id,
                 'name': skill_name,
-                'node_type': NodeType.SKILL.value,
-                'category': 'Technical' if skill_name in TECH_SKILLS else 'Business',
+                'node_type': self._NT_SKILL,
+                'category': 'Technical' if skill_name in TECH_SKILLS_SET else 'Business',
                 'individual_count': 0,
-                'created_at': datetime.utcnow().isoformat(),
-                'x': 0, 'y': 0
-            }
-            self.engine.add_node(skill_data)
+                'created_at': self._now
+            })
             self.generated_ids['skills'].append(skill_id)
+        self.engine.add_nodes(batch)
     
     def _generate_aggregated_companies(self):
         """Create Aggregated nodes for major companies"""
+        batch = []
         for company in MAJOR_COMPANIES:
-            agg_id = str(uuid.uuid4())
-            agg_data = {
+            agg_id = next(self._ids)
+            batch.append({
                 'id': agg_id,
                 'name': company['name'],
-                'node_type': NodeType.AGGREGATED.value,
+                'node_type': self._NT_AGGREGATED,
                 'sector': company['sector'],
                 'location': company['location'],
                 'description': f"{company['name']} - Major technology corporation",
                 'child_blob_ids': [],
                 'total_member_count': 0,
-                'created_at': datetime.utcnow().isoformat(),
-                'x': 0, 'y': 0
-            }
-            self.engine.add_node(agg_data)
+                'created_at': self._now
+            })
             self.generated_ids['aggregated'].append(agg_id)
-            
+
             # Store mapping for later
             company['aggregated_id'] = agg_id
+        self.engine.add_nodes(batch)
     
     def _generate_company_blobs(self):
         """Create internal Blobs for major companies"""
+        node_batch = []
+        edge_batch = []
         for company in MAJOR_COMPANIES:
             agg_id = company['aggregated_id']
-            
+
             for blob_name in company['blobs']:
-                blob_id = str(uuid.uuid4())
-                blob_data = {
+                blob_id = next(self._ids)
+                node_batch.append({
                     'id': blob_id,
                     'name': blob_name,
-                    'node_type': NodeType.BLOB.value,
-                    'blob_type': BlobType.INTERNAL.value,
+                    'node_type': self._NT_BLOB,
+                    'blob_type': self._BT_INTERNAL,
                     'sector': company['sector'],
                     'location': company['location'],
                     'description': f"{blob_name} division of {company['name']}",
                     'member_count': 0,
                     'parent_aggregated_id': agg_id,
-                    'created_at': datetime.utcnow().isoformat(),
-                    'x': 0, 'y': 0
-                }
-                self.engine.add_node(blob_data)
+                    'created_at': self._now
+                })
                 self.generated_ids['blobs'].append(blob_id)
-                
+
                 # Update aggregated node
                 self.engine.node_data[agg_id]['child_blob_ids'].append(blob_id)
-                
+
                 # Create CONTAINS edge
-                edge_data = {
-                    'id': str(uuid.uuid4()),
+                edge_batch.append({
+                    'id': next(self._ids),
                     'source': agg_id,
                     'target': blob_id,
-                    'edge_type': EdgeType.CONTAINS.value,
+                    'edge_type': self._ET_CONTAINS,
                     'weight': 1.0,
-                    'created_at': datetime.utcnow().isoformat()
-                }
-                self.engine.add_edge(edge_data)
+                    'created_at': self._now
+                })
+        self.engine.add_nodes(node_batch)
+        self.engine.add_edges(edge_batch)
     
     def _generate_smaller_companies(self):
         """Create standalone Company Blobs (not part of Aggregated)"""
+        batch = []
         for company in SMALLER_COMPANIES:
-            blob_id = str(uuid.uuid4())
-            blob_data = {
+            blob_id = next(self._ids)
+            batch.append({
                 'id': blob_id,
                 'name': company['name'],
-                'node_type': NodeType.BLOB.value,
-                'blob_type': BlobType.COMPANY.value,
+                'node_type': self._NT_BLOB,
+                'blob_type': self._BT_COMPANY,
                 'sector': company['sector'],
                 'location': company['location'],
                 'description': f"{company['name']} - Technology company",
                 'member_count': 0,
                 'parent_aggregated_id': None,
-                'created_at': datetime.utcnow().isoformat(),
-                'x': 0, 'y': 0
-            }
-            self.engine.add_node(blob_data)
+                'created_at': self._now
+            })
             self.generated_ids['blobs'].append(blob_id)
-    
+        self.engine.add_nodes(batch)
+
     def _generate_independent_blobs(self, count: int):
         """Create Independent Blobs (freelancer collectives, teams)"""
+        batch = []
         for i in range(count):
-            template = random.choice(INDEPENDENT_BLOB_TEMPLATES)
+            template = self.rng.choice(INDEPENDENT_BLOB_TEMPLATES)
             blob_name = f"{template} #{i+1}"
-            
-            blob_id = str(uuid.uuid4())
-            blob_data = {
+
+            blob_id = next(self._ids)
+            batch.append({
                 'id': blob_id,
                 'name': blob_name,
-                'node_type': NodeType.BLOB.value,
-                'blob_type': BlobType.INDEPENDENT.value,
-                'sector': random.choice(SECTORS),
-                'location': random.choice(LOCATIONS),
-                'description': f"Independent collective focused on {random.choice(TECH_SKILLS).lower()}",
+                'node_type': self._NT_BLOB,
+                'blob_type': self._BT_INDEPENDENT,
+                'sector': self.rng.choice(SECTORS),
+                'location': self.rng.choice(LOCATIONS),
+                'description': f"Independent collective focused on {self.rng.choice(TECH_SKILLS).lower()}",
                 'member_count': 0,
                 'parent_aggregated_id': None,
-                'created_at': datetime.utcnow().isoformat(),
-                'x': 0, 'y': 0
-            }
-            self.engine.add_node(blob_data)
+                'created_at': self._now
+            })
             self.generated_ids['blobs'].append(blob_id)
-    
+        self.engine.add_nodes(batch)
+
     def _generate_individuals(self, count: int):
         """Generate Individual nodes with skills"""
-        for i in range(count):
-            if i % 1000 == 0:
-                print(f"  Generated {i}/{count} individuals...")
-            
-            first_name = random.choice(FIRST_NAMES)
-            last_name = random.choice(LAST_NAMES)
-            
-            # Generate skills (2-8 skills per person)
-            num_skills = random.randint(2, 8)
-            # Bias towards tech skills
-            tech_count = random.randint(1, min(num_skills, len(TECH_SKILLS)))
-            business_count = num_skills - tech_count
-            
-            skills = random.sample(TECH_SKILLS, tech_count)
-            if business_count > 0:
-                skills += random.sample(BUSINESS_SKILLS, min(business_count, len(BUSINESS_SKILLS)))
-            
-            # Skill levels (1-5)
-            skill_levels = {skill: random.randint(2, 5) for skill in skills}
-            
-            ind_id = str(uuid.uuid4())
-            ind_data = {
-                'id': ind_id,
-                'name': f"{first_name} {last_name}",
-                'node_type': NodeType.INDIVIDUAL.value,
-                'skills': skills,
-                'skill_levels': skill_levels,
-                'availability': random.random() > 0.3,  # 70% available
-                'location': random.choice(LOCATIONS),
-                'sector': random.choice(SECTORS),
-                'bio': f"Professional with expertise in {', '.join(skills[:3])}",
-                'blob_memberships': [],
-                'created_at': datetime.utcnow().isoformat(),
-                'x': 0, 'y': 0
-            }
-            self.engine.add_node(ind_data)
+        workers = int(os.environ.get("GEN_WORKERS", "1"))
+
+        if workers > 1 and count >= 2000:
+            # Chunks are independent pure-random generation: expand in
+            # worker processes, merge on the main process
+            from multiprocessing import Pool
+
+            base, rem = divmod(count, workers)
+            sizes = [base + (1 if i < rem else 0) for i in range(workers)]
+            seeds = self._seed_seq.spawn(workers)
+            with Pool(workers) as pool:
+                chunks = pool.starmap(
+                    _build_individual_chunk,
+                    [(seed, n, self._now) for seed, n in zip(seeds, sizes)]
+                )
+            batch = [ind for chunk in chunks for ind in chunk]
+        else:
+            batch = _build_individual_chunk(self._seed_seq.spawn(1)[0], count, self._now)
+
+        for ind_data in batch:
+            ind_id = ind_data['id']
             self.generated_ids['individuals'].append(ind_id)
-    
+            for s in ind_data['skills']:
+                self._skill_index[s].append(ind_id)
+        self.engine.add_nodes(batch)
+
     def _generate_projects(self, count: int):
         """Generate Project nodes"""
         statuses = list(ProjectStatus)
-        
+
+        rng = self.rng
+        ids = self._ids
+        now = self._now
+
+        batch = []
         for i in range(count):
-            template = random.choice(PROJECT_TEMPLATES)
+            template = rng.choice(PROJECT_TEMPLATES)
             project_name = f"{template['name']} - Project #{i+1}"
             
-            proj_id = str(uuid.uuid4())
-            proj_data = {
+            proj_id = next(ids)
+            batch.append({
                 'id': proj_id,
                 'name': project_name,
-                'node_type': NodeType.PROJECT.value,
+                'node_type': self._NT_PROJECT,
                 'project_type': template['type'].value,
-                'status': random.choice(statuses).value,
+                'status': rng.choice(statuses).value,
                 'description': f"A {template['type'].value} project requiring {', '.join(template['skills'])}",
                 'required_skills': template['skills'],
-                'sector': random.choice(SECTORS),
-                'location': random.choice(LOCATIONS),
+                'sector': rng.choice(SECTORS),
+                'location': rng.choice(LOCATIONS),
                 'assigned_blob_ids': [],
                 'assigned_individual_ids': [],
-                'created_at': datetime.utcnow().isoformat(),
-                'x': 0, 'y': 0
-            }
-            self.engine.add_node(proj_data)
+                'created_at': now
+            })
             self.generated_ids['projects'].append(proj_id)
+        self.engine.add_nodes(batch)
     
     def _generate_relationships(self):
         """Generate edges between nodes"""
         print("Generating relationships...")
+
+        # Contiguous id array so blob draws are integer-index picks
+        # instead of random.sample over the id list
+        self._blobs_arr = np.array(self.generated_ids['blobs'], dtype=object)
         
         # 1. Assign individuals to blobs (MEMBER_OF)
         self._assign_individuals_to_blobs()
@@ -473,159 +652,242 @@ class DataGenerator:
     def _assign_individuals_to_blobs(self):
         """Assign individuals to blobs"""
         all_blobs = self.generated_ids['blobs']
-        
-        for ind_id in self.generated_ids['individuals']:
-            # Each individual belongs to 1-3 blobs
-            num_memberships = random.choices([1, 2, 3], weights=[0.7, 0.2, 0.1])[0]
-            selected_blobs = random.sample(all_blobs, min(num_memberships, len(all_blobs)))
-            
-            for blob_id in selected_blobs:
+        individuals = self.generated_ids['individuals']
+        if not all_blobs or not individuals:
+            return
+
+        rng = self.np_rng
+        # Each individual belongs to 1-3 blobs; draw all membership
+        # counts and blob picks up front instead of two Python RNG
+        # calls per individual
+        ks = rng.choice([1, 2, 3], size=len(individuals), p=[0.7, 0.2, 0.1])
+        picks = rng.integers(0, len(all_blobs), (len(individuals), 3))
+
+        edge_batch = []
+        node_data = self.engine.node_data
+        flat_picks = []
+
+        for i, ind_id in enumerate(individuals):
+            # Dedupe per row; duplicates are rare with hundreds of blobs
+            row = {picks[i, j] for j in range(ks[i])}
+            memberships = []
+            for b in row:
+                blob_id = all_blobs[b]
+                flat_picks.append(b)
+                memberships.append(blob_id)
+
                 # Create MEMBER_OF edge
-                edge_data = {
-                    'id': str(uuid.uuid4()),
+                edge_batch.append({
+                    'id': next(self._ids),
                     'source': ind_id,
                     'target': blob_id,
-                    'edge_type': EdgeType.MEMBER_OF.value,
+                    'edge_type': self._ET_MEMBER_OF,
                     'weight': 1.0,
-                    'created_at': datetime.utcnow().isoformat()
-                }
-                self.engine.add_edge(edge_data)
-                
-                # Update individual's memberships
-                self.engine.node_data[ind_id]['blob_memberships'].append(blob_id)
-                
-                # Update blob's member count
-                self.engine.node_data[blob_id]['member_count'] += 1
-        
+                    'created_at': self._now
+                })
+
+                self._blob_members[blob_id].append(i)
+
+            # Assign the final membership list in one write instead of
+            # appending per edge
+            node_data[ind_id]['blob_memberships'] = memberships
+
+        self.engine.add_edges(edge_batch)
+
+        # Write each blob's member count once instead of once per edge
+        counts = np.bincount(np.asarray(flat_picks), minlength=len(all_blobs))
+        for blob_id, count in zip(all_blobs, counts.tolist()):
+            node_data[blob_id]['member_count'] = count
+
         # Update aggregated member counts
         for agg_id in self.generated_ids['aggregated']:
-            total = 0
-            for blob_id in self.engine.node_data[agg_id].get('child_blob_ids', []):
-                total += self.engine.node_data[blob_id].get('member_count', 0)
-            self.engine.node_data[agg_id]['total_member_count'] = total
+            node_data[agg_id]['total_member_count'] = sum(
+                node_data[blob_id].get('member_count', 0)
+                for blob_id in node_data[agg_id].get('child_blob_ids', [])
+            )
     
     def _assign_individuals_to_projects(self):
         """Assign individuals to projects based on skill match"""
+        rng = self.rng
+        ids = self._ids
+        now = self._now
+        node_data = self.engine.node_data
+        skill_index = self._skill_index
+
+        edge_batch = []
         for proj_id in self.generated_ids['projects']:
-            project = self.engine.node_data[proj_id]
-            required_skills = set(project.get('required_skills', []))
-            
-            # Find individuals with matching skills
-            matching_individuals = []
-            for ind_id in self.generated_ids['individuals']:
-                ind = self.engine.node_data[ind_id]
-                ind_skills = set(ind.get('skills', []))
-                if ind_skills & required_skills:  # Any overlap
-                    matching_individuals.append(ind_id)
-            
+            project = node_data[proj_id]
+            required_skills = project.get('required_skills', [])
+
+            # Union the posting lists of the required skills instead of
+            # scanning every individual per project; skip the set
+            # machinery entirely when no skill has any holders
+            # Order-preserving dedupe: posting lists are in creation
+            # order, so seeded runs sample the same individuals (a set
+            # union here would follow string-hash order)
+            postings = [skill_index[s] for s in required_skills if s in skill_index]
+            matching_individuals = list(dict.fromkeys(
+                chain.from_iterable(postings))) if postings else []
+
             # Assign 2-10 individuals per project
-            num_assigned = random.randint(2, min(10, len(matching_individuals)))
-            assigned = random.sample(matching_individuals, num_assigned) if matching_individuals else []
+            if len(matching_individuals) >= 2:
+                num_assigned = rng.randint(2, min(10, len(matching_individuals)))
+            else:
+                num_assigned = len(matching_individuals)
+            assigned = rng.sample(matching_individuals, num_assigned) if matching_individuals else []
             
             for ind_id in assigned:
-                edge_data = {
-                    'id': str(uuid.uuid4()),
+                edge_batch.append({
+                    'id': next(ids),
                     'source': ind_id,
                     'target': proj_id,
-                    'edge_type': EdgeType.WORKS_ON.value,
+                    'edge_type': self._ET_WORKS_ON,
                     'weight': 1.0,
-                    'created_at': datetime.utcnow().isoformat()
-                }
-                self.engine.add_edge(edge_data)
-                self.engine.node_data[proj_id]['assigned_individual_ids'].append(ind_id)
+                    'created_at': now
+                })
+                node_data[proj_id]['assigned_individual_ids'].append(ind_id)
+        self.engine.add_edges(edge_batch)
     
     def _assign_blobs_to_projects(self):
         """Assign blobs to execute projects"""
+        rng = self.np_rng
+        ids = self._ids
+        now = self._now
+        node_data = self.engine.node_data
+        blobs_arr = self._blobs_arr
+        num_blobs_pool = len(blobs_arr)
+
+        edge_batch = []
         for proj_id in self.generated_ids['projects']:
             # 1-3 blobs per project
-            num_blobs = random.randint(1, 3)
-            selected_blobs = random.sample(
-                self.generated_ids['blobs'],
-                min(num_blobs, len(self.generated_ids['blobs']))
-            )
-            
+            num_blobs = min(int(rng.integers(1, 4)), num_blobs_pool)
+            selected_blobs = blobs_arr[rng.choice(num_blobs_pool, num_blobs, replace=False)]
+
             for blob_id in selected_blobs:
-                edge_data = {
-                    'id': str(uuid.uuid4()),
+                edge_batch.append({
+                    'id': next(ids),
                     'source': blob_id,
                     'target': proj_id,
-                    'edge_type': EdgeType.EXECUTES.value,
+                    'edge_type': self._ET_EXECUTES,
                     'weight': 1.0,
-                    'created_at': datetime.utcnow().isoformat()
-                }
-                self.engine.add_edge(edge_data)
-                self.engine.node_data[proj_id]['assigned_blob_ids'].append(blob_id)
+                    'created_at': now
+                })
+                node_data[proj_id]['assigned_blob_ids'].append(blob_id)
+        self.engine.add_edges(edge_batch)
     
     def _create_peer_connections(self):
         """Create peer-to-peer connections between individuals"""
-        # Each individual has 3-15 peer connections
+        # Each individual has 3-15 peer connections, biased towards
+        # members of the same blobs. Two-pool draw: each pick lands in
+        # the shared-blob pool with the probability implied by the old
+        # 3x weighting (3L / (3L + n-1-L) for pool size L) and in the
+        # full population otherwise, instead of rebuilding a weighted
+        # candidate list per individual.
         individuals = self.generated_ids['individuals']
-        
-        for ind_id in individuals:
-            num_peers = random.randint(3, 15)
-            # Prefer connections within same blobs
-            ind_blobs = set(self.engine.node_data[ind_id].get('blob_memberships', []))
-            
-            potential_peers = []
-            for other_id in individuals:
-                if other_id == ind_id:
-                    continue
-                other_blobs = set(self.engine.node_data[other_id].get('blob_memberships', []))
-                # Higher chance if in same blob
-                if ind_blobs & other_blobs:
-                    potential_peers.extend([other_id] * 3)  # 3x weight
-                else:
-                    potential_peers.append(other_id)
-            
-            # Select peers (avoid duplicates)
-            selected = set()
-            for _ in range(num_peers * 2):  # Try more times to get enough unique
-                if len(selected) >= num_peers:
-                    break
-                peer = random.choice(potential_peers)
-                selected.add(peer)
-            
-            for peer_id in selected:
-                # Check if edge already exists
-                if self.engine.graph.has_edge(ind_id, peer_id):
-                    continue
-                
-                edge_data = {
-                    'id': str(uuid.uuid4()),
-                    'source': ind_id,
-                    'target': peer_id,
-                    'edge_type': EdgeType.PEER.value,
-                    'weight': random.uniform(0.5, 1.0),
-                    'created_at': datetime.utcnow().isoformat()
-                }
-                self.engine.add_edge(edge_data)
+        if not individuals:
+            return
+
+        rng = self.np_rng
+        node_data = self.engine.node_data
+        n = len(individuals)
+
+        # Flatten the membership maps to CSR arrays the kernel can walk
+        # without touching Python objects; member lists already hold
+        # dense individual indices
+        blobs = list(self._blob_members.keys())
+        blob_idx = {blob_id: i for i, blob_id in enumerate(blobs)}
+
+        blob_indptr = np.zeros(len(blobs) + 1, np.int64)
+        blob_lists = []
+        for i, blob_id in enumerate(blobs):
+            members = self._blob_members[blob_id]
+            blob_indptr[i + 1] = blob_indptr[i] + len(members)
+            blob_lists.extend(members)
+        blob_indices = np.asarray(blob_lists, np.int64)
+
+        ind_blob_indptr = np.zeros(n + 1, np.int64)
+        ind_blob_lists = []
+        for i, ind_id in enumerate(individuals):
+            memberships = node_data[ind_id].get('blob_memberships', [])
+            ind_blob_indptr[i + 1] = ind_blob_indptr[i] + len(memberships)
+            ind_blob_lists.extend(blob_idx[b] for b in memberships)
+        ind_blob_indices = np.asarray(ind_blob_lists, np.int64)
+
+        num_peers_all = rng.integers(3, 16, n)
+
+        # Per-individual local-pick probability from the 3x weighting:
+        # shared-blob candidates carried weight 3 against 1 for the
+        # rest of the population
+        blob_sizes = blob_indptr[1:] - blob_indptr[:-1]
+        cum = np.concatenate(([0], np.cumsum(blob_sizes[ind_blob_indices])))
+        pool_sizes = cum[ind_blob_indptr[1:]] - cum[ind_blob_indptr[:-1]]
+        rest = np.maximum(n - 1 - pool_sizes, 0)
+        p_local = np.divide(3.0 * pool_sizes, 3.0 * pool_sizes + rest,
+                            out=np.zeros(n), where=pool_sizes > 0)
+        k_local_all = rng.binomial(num_peers_all, p_local)
+
+        # One pre-drawn variate per peer draw keeps the kernel free of
+        # its own (unseeded) RNG state
+        uniforms = rng.random(int(num_peers_all.sum()))
+
+        src, dst = _peer_edge_kernel(
+            ind_blob_indptr, ind_blob_indices,
+            blob_indptr, blob_indices,
+            num_peers_all, k_local_all, uniforms, n
+        )
+
+        # Canonicalize pairs and dedupe in one vectorized pass
+        lo = np.minimum(src, dst)
+        hi = np.maximum(src, dst)
+        _, first = np.unique(lo * n + hi, return_index=True)
+
+        edge_batch = [{
+            'id': next(self._ids),
+            'source': individuals[src[t]],
+            'target': individuals[dst[t]],
+            'edge_type': self._ET_PEER,
+            'weight': self.rng.uniform(0.5, 1.0),
+            'created_at': self._now
+        } for t in first]
+
+        self.engine.add_edges(edge_batch)
     
     def _create_blob_collaborations(self):
         """Create collaboration edges between blobs"""
-        blobs = self.generated_ids['blobs']
-        
-        # Create 50-100 blob collaborations
-        num_collabs = random.randint(50, 100)
-        
-        for _ in range(num_collabs):
-            blob1, blob2 = random.sample(blobs, 2)
-            
-            if self.engine.graph.has_edge(blob1, blob2):
+        blobs_arr = self._blobs_arr
+        rng = self.np_rng
+
+        # Create 50-100 blob collaborations; draw all index pairs up
+        # front and map back to ids
+        num_collabs = self.rng.randint(50, 100)
+        pairs = rng.integers(0, len(blobs_arr), (num_collabs, 2))
+
+        seen = set()
+        edge_batch = []
+        for i, j in pairs:
+            if i == j:
                 continue
-            
-            edge_data = {
-                'id': str(uuid.uuid4()),
+            blob1, blob2 = blobs_arr[i], blobs_arr[j]
+
+            key = (blob1, blob2) if blob1 < blob2 else (blob2, blob1)
+            if key in seen:
+                continue
+            seen.add(key)
+
+            edge_batch.append({
+                'id': next(self._ids),
                 'source': blob1,
                 'target': blob2,
-                'edge_type': EdgeType.COLLABORATES.value,
-                'weight': random.uniform(0.5, 1.0),
-                'created_at': datetime.utcnow().isoformat()
-            }
-            self.engine.add_edge(edge_data)
+                'edge_type': self._ET_COLLABORATES,
+                'weight': self.rng.uniform(0.5, 1.0),
+                'created_at': self._now
+            })
+        self.engine.add_edges(edge_batch)
 
 
-def generate_test_data(engine: GraphEngine, num_individuals: int = 10000):
+def generate_test_data(engine: GraphEngine, num_individuals: int = 10000,
+                       seed: Optional[int] = None):
     """Convenience function to generate test data"""
-    generator = DataGenerator(engine)
+    generator = DataGenerator(engine, seed=seed)
     generator.generate_all(num_individuals=num_individuals)
     return generator.generated_ids
@@ -2,13 +2,18 @@
 Graph Engine - Core graph operations using NetworkX
 Handles node/edge management, layout computation, and graph algorithms
 """
-import networkx as nx
-import numpy as np
-from typing import Dict, List, Optional, Set, Tuple, Any
-from collections import defaultdict
 import json
-from datetime import datetime
 import logging
+import re
+import time
+from bisect import bisect_left
+from collections import defaultdict, deque
+from datetime import datetime
+from itertools import islice
+from typing import Dict, List, Optional, Set, Tuple, Any
+
+import networkx as nx
+import numpy as np
 
 from models import (
     NodeType, EdgeType, BlobType, ProjectStatus, ProjectType,
@@ -16,26 +21,242 @@ from models import (
     Edge, ViewportRequest, GraphData
 )
 
+try:
+    # Optional: compiled CSR traversals for large-graph BFS
+    from scipy.sparse import csgraph as _csgraph
+except ImportError:
+    _csgraph = None
+
+try:
+    # Optional: fast JSON encoding for serialization
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # Optional: JIT-compile the BFS and layout kernels when numba is
+    # installed
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
+
+def _bfs_depth_kernel(indptr, indices, start, max_depth, n):
+    """Depth-limited BFS over CSR adjacency; returns a visited bitmap."""
+    visited = np.zeros(n, np.uint8)
+    frontier = np.empty(n, np.int64)
+    nxt = np.empty(n, np.int64)
+    visited[start] = 1
+    frontier[0] = start
+    f_len = 1
+    for _ in range(max_depth):
+        n_len = 0
+        for fi in range(f_len):
+            u = frontier[fi]
+            for ei in range(indptr[u], indptr[u + 1]):
+                v = indices[ei]
+                if visited[v] == 0:
+                    visited[v] = 1
+                    nxt[n_len] = v
+                    n_len += 1
+        if n_len == 0:
+            break
+        frontier, nxt = nxt, frontier
+        f_len = n_len
+    return visited
+
+
+def _fr_layout_kernel(indptr, indices, pos, iterations, k):
+    """Fruchterman-Reingold over CSR adjacency with grid-approximated
+    repulsion: far-field forces come from cell centroids, near-field is
+    exact within a node's own cell."""
+    n = pos.shape[0]
+    g = int(n ** 0.25) + 1
+    ncells = g * g
+    disp = np.zeros((n, 2), np.float32)
+    cell_of = np.zeros(n, np.int64)
+    cmass = np.zeros(ncells, np.float64)
+    ccx = np.zeros(ncells, np.float64)
+    ccy = np.zeros(ncells, np.float64)
+    cstart = np.zeros(ncells + 1, np.int64)
+    corder = np.zeros(n, np.int64)
+
+    for it in range(iterations):
+        t = 0.1 * (1.0 - it / iterations) + 0.01
+
+        # Bucket nodes into the grid and accumulate cell centroids
+        minx = pos[:, 0].min()
+        miny = pos[:, 1].min()
+        wx = (pos[:, 0].max() - minx) / g + 1e-9
+        wy = (pos[:, 1].max() - miny) / g + 1e-9
+        cmass[:] = 0.0
+        ccx[:] = 0.0
+        ccy[:] = 0.0
+        for i in range(n):
+            ci = min(int((pos[i, 0] - minx) / wx), g - 1)
+            cj = min(int((pos[i, 1] - miny) / wy), g - 1)
+            c = ci * g + cj
+            cell_of[i] = c
+            cmass[c] += 1.0
+            ccx[c] += pos[i, 0]
+            ccy[c] += pos[i, 1]
+        for c in range(ncells):
+            if cmass[c] > 0.0:
+                ccx[c] /= cmass[c]
+                ccy[c] /= cmass[c]
+        cstart[:] = 0
+        for i in range(n):
+            cstart[cell_of[i] + 1] += 1
+        for c in range(ncells):
+            cstart[c + 1] += cstart[c]
+        fill = cstart.copy()
+        for i in range(n):
+            corder[fill[cell_of[i]]] = i
+            fill[cell_of[i]] += 1
+
+        for i in prange(n):
+            dx = 0.0
+            dy = 0.0
+            xi = pos[i, 0]
+            yi = pos[i, 1]
+            own = cell_of[i]
+            # Far-field repulsion from cell centroids
+            for c in range(ncells):
+                if c == own or cmass[c] == 0.0:
+                    continue
+                ddx = xi - ccx[c]
+                ddy = yi - ccy[c]
+                d2 = ddx * ddx + ddy * ddy + 1e-9
+                f = k * k * cmass[c] / d2
+                dx += ddx * f
+                dy += ddy * f
+            # Exact repulsion within the node's own cell
+            for s in range(cstart[own], cstart[own + 1]):
+                j = corder[s]
+                if j == i:
+                    continue
+                ddx = xi - pos[j, 0]
+                ddy = yi - pos[j, 1]
+                d2 = ddx * ddx + ddy * ddy + 1e-9
+                f = k * k / d2
+                dx += ddx * f
+                dy += ddy * f
+            # Attraction along edges
+            for s in range(indptr[i], indptr[i + 1]):
+                j = indices[s]
+                ddx = xi - pos[j, 0]
+                ddy = yi - pos[j, 1]
+                d = (ddx * ddx + ddy * ddy) ** 0.5 + 1e-9
+                dx -= ddx * d / k
+                dy -= ddy * d / k
+            disp[i, 0] = dx
+            disp[i, 1] = dy
+
+        # Apply displacements, clamped by the cooling temperature
+        for i in range(n):
+            dx = disp[i, 0]
+            dy = disp[i, 1]
+            d = (dx * dx + dy * dy) ** 0.5
+            if d > t:
+                dx = dx / d * t
+                dy = dy / d * t
+            pos[i, 0] += dx
+            pos[i, 1] += dy
+    return pos
+
+
+if njit is not None:
+    _bfs_depth_kernel = njit(cache=True)(_bfs_depth_kernel)
+    _fr_layout_kernel = njit(cache=True, parallel=True)(_fr_layout_kernel)
+
+
 logger = logging.getLogger(__name__)
 
+_TOKEN_RE = re.compile(r'\w+')
+
+# Viewport queries repeat under sub-pixel pans: cache responses briefly,
+# quantized to a pan-step grid and keyed on a mutation version counter
+_VIEWPORT_CACHE_SIZE = 200
+_VIEWPORT_CACHE_TTL = 1.0
+_VIEWPORT_CACHE_GRID = 16.0
+
+# Value -> enum lookup table; enum __call__ is measurable on bulk loads.
+# Maps both value strings and enum members so callers may pass either.
+_NT = {nt.value: nt for nt in NodeType}
+_NT.update({nt: nt for nt in NodeType})
+
+# Memoized str.lower for index keys; the skill/sector/location
+# vocabulary is small, so bulk loads mostly hit the cache
+_lower_cache: Dict[str, str] = {}
+
+
+def _lower(s: str) -> str:
+    v = _lower_cache.get(s)
+    if v is None:
+        v = s.lower()
+        _lower_cache[s] = v
+    return v
+
 
 class GraphEngine:
     def __init__(self):
         self.graph = nx.Graph()
         self.node_data: Dict[str, dict] = {}
         self.edge_data: Dict[str, dict] = {}
+        # Canonical (min, max) endpoint pair -> edge ids. nx.Graph
+        # collapses parallel edges to one adjacency entry, so node
+        # removal needs this to drop every duplicate-pair row
+        self._edges_by_pair: Dict[Tuple[str, str], Set[str]] = defaultdict(set)
         
-        # Pre-computed layouts at different zoom levels
-        self.layouts: Dict[int, Dict[str, Tuple[float, float]]] = {}
+        # Pre-computed layouts at different zoom levels, packed as
+        # (id -> row, float32 xy array) pairs to keep position storage
+        # contiguous instead of per-node float tuples
+        self.layouts: Dict[int, Tuple[Dict[str, int], np.ndarray]] = {}
         
         # Index structures for fast queries
         self.nodes_by_type: Dict[NodeType, Set[str]] = defaultdict(set)
         self.nodes_by_skill: Dict[str, Set[str]] = defaultdict(set)
         self.nodes_by_sector: Dict[str, Set[str]] = defaultdict(set)
         self.nodes_by_location: Dict[str, Set[str]] = defaultdict(set)
+
+        # Cached lowercase searchable text per node plus a token
+        # inverted index used to fast-path text queries
+        self._search_text: Dict[str, str] = {}
+        self._token_index: Dict[str, Set[str]] = defaultdict(set)
+
+        # Sorted location keys for bisect-based prefix matching
+        self._loc_keys_sorted: List[str] = []
+
+        # Cached skill frozensets for similarity scoring
+        self._skills_by_node: Dict[str, frozenset] = {}
         
         # Spatial index bounds
         self.bounds = {'min_x': 0, 'max_x': 1000, 'min_y': 0, 'max_y': 1000}
+
+        # Struct-of-arrays view of node positions: contiguous float32
+        # x/y plus a parallel id array, rebuilt lazily for vectorized
+        # consumers (layout, spatial queries). The node dicts stay the
+        # source of truth.
+        self._pos_ids: Optional[np.ndarray] = None
+        self._pos_xy: Optional[np.ndarray] = None
+        self._pos_dirty = True
+
+        # Coarse uniform grid over positions for sublinear viewport
+        # queries; rebuilt together with the position arrays
+        self._grid: Optional[Dict[Tuple[int, int], Set[str]]] = None
+        self._grid_cell = 1.0
+
+        # Lazy CSR adjacency mirror for compiled BFS on large graphs
+        self._csr = None
+        self._csr_ids: List[str] = []
+        self._csr_idx: Dict[str, int] = {}
+
+        # Short-lived LRU of viewport responses. Any mutation bumps
+        # _version, which is part of every cache key, so stale entries
+        # simply stop matching and age out of the LRU.
+        self._version = 0
+        self._viewport_cache: Dict[tuple, Tuple[float, GraphData]] = {}
         
     # ============================================
     # Node Operations
@@ -44,36 +265,118 @@ class GraphEngine:
     def add_node(self, node_data: dict) -> str:
         """Add a node to the graph"""
         node_id = node_data.get('id')
-        node_type = NodeType(node_data.get('node_type'))
-        
+
         # Add to NetworkX graph
         self.graph.add_node(node_id)
-        
+
         # Store full node data
         self.node_data[node_id] = node_data
-        
+
         # Update indices
+        self._index_node(node_id, node_data)
+        self._csr = None
+        self._version += 1
+
+        return node_id
+
+    def add_nodes(self, batch: List[dict]) -> List[str]:
+        """
+        Add many nodes in one call.
+        Bulk inserts into NetworkX and the node table so dicts grow once
+        per batch instead of once per node.
+        """
+        ids = [d['id'] for d in batch]
+        self.graph.add_nodes_from(ids)
+        self.node_data.update(zip(ids, batch))
+
+        for node_data in batch:
+            self._index_node(node_data['id'], node_data)
+        self._csr = None
+        self._version += 1
+
+        return ids
+
+    def _index_node(self, node_id: str, node_data: dict):
+        """Update the type/skill/sector/location indices for a node"""
+        node_type = _NT.get(node_data.get('node_type'))
         self.nodes_by_type[node_type].add(node_id)
-        
+
         if 'skills' in node_data:
             for skill in node_data['skills']:
-                self.nodes_by_skill[skill.lower()].add(node_id)
-        
+                self.nodes_by_skill[_lower(skill)].add(node_id)
+            self._skills_by_node[node_id] = frozenset(node_data['skills'])
+
         if 'sector' in node_data and node_data['sector']:
-            self.nodes_by_sector[node_data['sector'].lower()].add(node_id)
-            
+            self.nodes_by_sector[_lower(node_data['sector'])].add(node_id)
+
         if 'location' in node_data and node_data['location']:
-            self.nodes_by_location[node_data['location'].lower()].add(node_id)
-        
-        return node_id
-    
+            self.nodes_by_location[_lower(node_data['location'])].add(node_id)
+
+        self._index_search_text(node_id, node_data)
+
+        self._pos_dirty = True
+
+    def _index_search_text(self, node_id: str, node_data: dict):
+        """Cache a node's lowercase searchable text and index its tokens"""
+        # Optional fields are stored as None when omitted, so the
+        # defaults must come from `or`, not from .get()
+        txt = ' '.join([
+            node_data.get('name') or '',
+            node_data.get('description') or '',
+            node_data.get('bio') or '',
+            ' '.join(node_data.get('skills') or [])
+        ]).lower()
+        self._search_text[node_id] = txt
+        for token in set(_TOKEN_RE.findall(txt)):
+            self._token_index[token].add(node_id)
+
+    def _unindex_search_text(self, node_id: str):
+        """Drop a node's cached text and token postings"""
+        txt = self._search_text.pop(node_id, None)
+        if txt:
+            for token in set(_TOKEN_RE.findall(txt)):
+                self._token_index[token].discard(node_id)
+
+    def _position_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Get the (ids, xy) position arrays, rebuilding them if stale"""
+        if self._pos_dirty or self._pos_ids is None:
+            n = len(self.node_data)
+            ids = np.empty(n, dtype=object)
+            xy = np.empty((n, 2), dtype=np.float32)
+            for i, (node_id, node) in enumerate(self.node_data.items()):
+                ids[i] = node_id
+                xy[i, 0] = node.get('x', 0.0)
+                xy[i, 1] = node.get('y', 0.0)
+            self._pos_ids = ids
+            self._pos_xy = xy
+            self._pos_dirty = False
+            self._grid = None
+        return self._pos_ids, self._pos_xy
+
+    def _grid_index(self) -> Tuple[Dict[Tuple[int, int], Set[str]], float]:
+        """Get the spatial grid (cell -> node ids), rebuilding if stale"""
+        ids, xy = self._position_arrays()
+        if self._grid is None:
+            n = max(len(ids), 1)
+            width = max(self.bounds['max_x'] - self.bounds['min_x'], 1.0)
+            height = max(self.bounds['max_y'] - self.bounds['min_y'], 1.0)
+            cell = max((width * height / n) ** 0.5, 1e-6)
+            cx = np.floor(xy[:, 0] / cell).astype(np.int64)
+            cy = np.floor(xy[:, 1] / cell).astype(np.int64)
+            grid: Dict[Tuple[int, int], Set[str]] = defaultdict(set)
+            for i in range(len(ids)):
+                grid[(cx[i], cy[i])].add(ids[i])
+            self._grid = grid
+            self._grid_cell = cell
+        return self._grid, self._grid_cell
+
     def remove_node(self, node_id: str) -> Tuple[bool, int]:
         """Remove a node and all its edges. Returns (success, deleted_edge_count)"""
         if node_id not in self.node_data:
             return False, 0
         
         node_data = self.node_data[node_id]
-        node_type = NodeType(node_data.get('node_type'))
+        node_type = _NT.get(node_data.get('node_type'))
         
         # Count edges to be removed
         edge_count = self.graph.degree(node_id)
@@ -84,34 +387,49 @@ class GraphEngine:
         if 'skills' in node_data:
             for skill in node_data['skills']:
                 self.nodes_by_skill[skill.lower()].discard(node_id)
+            self._skills_by_node.pop(node_id, None)
         
         if 'sector' in node_data and node_data['sector']:
             self.nodes_by_sector[node_data['sector'].lower()].discard(node_id)
             
         if 'location' in node_data and node_data['location']:
             self.nodes_by_location[node_data['location'].lower()].discard(node_id)
-        
-        # Remove edges from edge_data
-        edges_to_remove = []
-        for edge_id, edge in self.edge_data.items():
-            if edge['source'] == node_id or edge['target'] == node_id:
-                edges_to_remove.append(edge_id)
-        
-        for edge_id in edges_to_remove:
-            del self.edge_data[edge_id]
+
+        self._unindex_search_text(node_id)
+        
+        # Remove incident edges from edge_data via the pair index
+        # (O(degree) instead of scanning the whole edge table); the
+        # index also holds duplicate-pair rows the NetworkX adjacency
+        # collapsed to a single edge_id
+        for neighbor_id in self.graph.adj[node_id]:
+            pair = ((node_id, neighbor_id) if node_id < neighbor_id
+                    else (neighbor_id, node_id))
+            for edge_id in self._edges_by_pair.pop(pair, ()):
+                self.edge_data.pop(edge_id, None)
         
         # Remove from NetworkX
         self.graph.remove_node(node_id)
         
         # Remove from node_data
         del self.node_data[node_id]
-        
+
+        self._pos_dirty = True
+        self._csr = None
+        self._version += 1
+
         return True, edge_count
     
     def get_node(self, node_id: str) -> Optional[dict]:
         """Get node data by ID"""
         return self.node_data.get(node_id)
-    
+
+    def get_position(self, node_id: str) -> Tuple[float, float]:
+        """Get a node's layout position, defaulting to the origin"""
+        node = self.node_data.get(node_id)
+        if node is None:
+            return (0.0, 0.0)
+        return (node.get('x', 0.0), node.get('y', 0.0))
+
     def update_node(self, node_id: str, updates: dict) -> bool:
         """Update node data"""
         if node_id not in self.node_data:
@@ -126,9 +444,10 @@ class GraphEngine:
             new_skills = set(updates['skills'])
             
             for skill in old_skills - new_skills:
-                self.nodes_by_skill[skill.lower()].discard(node_id)
+                self.nodes_by_skill[_lower(skill)].discard(node_id)
             for skill in new_skills - old_skills:
-                self.nodes_by_skill[skill.lower()].add(node_id)
+                self.nodes_by_skill[_lower(skill)].add(node_id)
+            self._skills_by_node[node_id] = frozenset(new_skills)
         
         # Update sector index
         if 'sector' in updates:
@@ -146,6 +465,12 @@ class GraphEngine:
         
         # Apply updates
         self.node_data[node_id].update(updates)
+        if not updates.keys().isdisjoint(('name', 'description', 'bio', 'skills')):
+            self._unindex_search_text(node_id)
+            self._index_search_text(node_id, self.node_data[node_id])
+        if 'x' in updates or 'y' in updates:
+            self._pos_dirty = True
+        self._version += 1
         return True
     
     # ============================================
@@ -164,9 +489,79 @@ class GraphEngine:
         
         # Store edge data
         self.edge_data[edge_id] = edge_data
-        
+        pair = (source, target) if source < target else (target, source)
+        self._edges_by_pair[pair].add(edge_id)
+        self._csr = None
+        self._version += 1
+
         return edge_id
+
+    def add_edges(self, batch: List[dict]) -> List[str]:
+        """
+        Add many edges in one call.
+        Single NetworkX bulk insert plus one edge-table update.
+        """
+        ids = [d['id'] for d in batch]
+        self.graph.add_edges_from(
+            (d['source'], d['target'],
+             {'weight': d.get('weight', 1.0), 'edge_id': d['id']})
+            for d in batch
+        )
+        self.edge_data.update(zip(ids, batch))
+        edges_by_pair = self._edges_by_pair
+        for d in batch:
+            source, target = d['source'], d['target']
+            pair = (source, target) if source < target else (target, source)
+            edges_by_pair[pair].add(d['id'])
+        self._csr = None
+        self._version += 1
+
+        return ids
     
+    def focus_subgraph(self, center_id: str,
+                       max_depth: int = 3) -> Tuple[Set[str], List[dict]]:
+        """
+        Depth-limited BFS from center_id that collects the edges among
+        the visited nodes in the same adjacency walk, so focus queries
+        need no second pass over a subgraph. Each internal edge is
+        recorded once, when its later-dequeued endpoint sees the
+        earlier one.
+        """
+        if center_id not in self.graph:
+            return set(), []
+        adj = self.graph.adj
+        edge_data = self.edge_data
+        visited = {center_id}
+        done: Set[str] = set()
+        edges: List[dict] = []
+        queue = deque([(center_id, 0)])
+        while queue:
+            u, depth = queue.popleft()
+            done.add(u)
+            for v, d in adj[u].items():
+                if v in done:
+                    edge = edge_data.get(d.get('edge_id'))
+                    if edge is not None:
+                        edges.append(edge)
+                elif v not in visited and depth < max_depth:
+                    visited.add(v)
+                    queue.append((v, depth + 1))
+        return visited, edges
+
+    def edges_between(self, node_ids: Set[str]) -> List[dict]:
+        """
+        Edges with both endpoints in node_ids, gathered by walking the
+        induced subgraph's adjacency (O(local degrees), not O(|E|)).
+        Undirected edges enumerate once, so no dedupe set is needed.
+        """
+        edge_data = self.edge_data
+        edges = []
+        for _, _, d in self.graph.subgraph(node_ids).edges(data=True):
+            edge = edge_data.get(d.get('edge_id'))
+            if edge is not None:
+                edges.append(edge)
+        return edges
+
     def remove_edge(self, edge_id: str) -> bool:
         """Remove an edge by ID"""
         if edge_id not in self.edge_data:
@@ -175,10 +570,20 @@ class GraphEngine:
         edge = self.edge_data[edge_id]
         source, target = edge['source'], edge['target']
         
-        if self.graph.has_edge(source, target):
+        pair = (source, target) if source < target else (target, source)
+        remaining = self._edges_by_pair.get(pair)
+        if remaining is not None:
+            remaining.discard(edge_id)
+            if not remaining:
+                del self._edges_by_pair[pair]
+        
+        # Keep the adjacency entry while duplicate-pair rows remain
+        if not remaining and self.graph.has_edge(source, target):
             self.graph.remove_edge(source, target)
         
         del self.edge_data[edge_id]
+        self._csr = None
+        self._version += 1
         return True
     
     # ============================================
@@ -190,14 +595,39 @@ class GraphEngine:
         if len(self.graph.nodes) == 0:
             return {}
         
-        logger.info(f"Computing layout for {len(self.graph.nodes)} nodes...")
-        
+        logger.info("Computing layout for %d nodes...", len(self.graph.nodes))
+
+        n = len(self.graph.nodes)
+
+        # Warm-start from the previous layout when it still covers most
+        # of the graph; converging from known-good positions needs far
+        # fewer iterations than a cold random start
+        warm = None
+        prev = self.layouts.get(1)
+        if prev:
+            prev_idx, prev_xy = prev
+            warm = {nid: prev_xy[prev_idx[nid]]
+                    for nid in self.graph.nodes if nid in prev_idx}
+            if len(warm) < n // 2:
+                warm = None
+        if warm is not None:
+            pos = nx.spring_layout(
+                self.graph,
+                k=(2.0 if n > 5000 else 1.5) / np.sqrt(n),
+                pos=warm,
+                iterations=20,
+                scale=scale,
+                center=(scale/2, scale/2)
+            )
+        # Large cold starts run the compiled FR kernel when available
+        elif n > 5000 and njit is not None:
+            pos = self._fr_layout(scale=scale, iterations=50)
         # Use spring layout with optimizations for large graphs
-        if len(self.graph.nodes) > 5000:
+        elif n > 5000:
             # For large graphs, use faster algorithm with fewer iterations
             pos = nx.spring_layout(
                 self.graph, 
-                k=2.0/np.sqrt(len(self.graph.nodes)),
+                k=2.0/np.sqrt(n),
                 iterations=50,
                 scale=scale,
                 center=(scale/2, scale/2)
@@ -205,7 +635,7 @@ class GraphEngine:
         else:
             pos = nx.spring_layout(
                 self.graph,
-                k=1.5/np.sqrt(len(self.graph.nodes)) if len(self.graph.nodes) > 0 else 1,
+                k=1.5/np.sqrt(n) if n > 0 else 1,
                 iterations=100,
                 scale=scale,
                 center=(scale/2, scale/2)
@@ -219,22 +649,48 @@ class GraphEngine:
                 self.node_data[node_id]['x'] = float(x)
                 self.node_data[node_id]['y'] = float(y)
         
-        # Update bounds
+        self._pos_dirty = True
+
+        # Update bounds from the contiguous position array
         if layout:
-            xs = [p[0] for p in layout.values()]
-            ys = [p[1] for p in layout.values()]
+            _, xy = self._position_arrays()
+            min_xy = xy.min(axis=0)
+            max_xy = xy.max(axis=0)
             self.bounds = {
-                'min_x': min(xs) - 50,
-                'max_x': max(xs) + 50,
-                'min_y': min(ys) - 50,
-                'max_y': max(ys) + 50
+                'min_x': float(min_xy[0]) - 50,
+                'max_x': float(max_xy[0]) + 50,
+                'min_y': float(min_xy[1]) - 50,
+                'max_y': float(max_xy[1]) + 50
             }
         
-        self.layouts[1] = layout  # Store as default zoom level
+        self.layouts[1] = self._pack_layout(layout)  # Store as default zoom level
         logger.info("Layout computation complete")
         
         return layout
     
+    @staticmethod
+    def _pack_layout(layout: Dict[str, Tuple[float, float]]) -> Tuple[Dict[str, int], np.ndarray]:
+        """Pack an id -> (x, y) mapping into (id -> row, float32 array) form"""
+        idx = {nid: i for i, nid in enumerate(layout)}
+        xy = np.array(list(layout.values()), dtype=np.float32).reshape(len(layout), 2)
+        return idx, xy
+
+    def _fr_layout(self, scale: float, iterations: int) -> Dict[str, Tuple[float, float]]:
+        """Run the JIT Fruchterman-Reingold kernel over the CSR mirror"""
+        csr, ids, _ = self._csr_adjacency()
+        n = len(ids)
+        pos = np.random.random((n, 2)).astype(np.float32)
+        pos = _fr_layout_kernel(
+            self._csr_indptr, self._csr_indices, pos, iterations,
+            1.0 / np.sqrt(n)
+        )
+        # Min-max rescale into the requested square
+        mn = pos.min(axis=0)
+        span = pos.max(axis=0) - mn
+        span[span == 0] = 1.0
+        pos = (pos - mn) / span * scale
+        return {ids[i]: (float(pos[i, 0]), float(pos[i, 1])) for i in range(n)}
+
     def compute_hierarchical_layouts(self):
         """Compute layouts for different zoom levels"""
         # Level 0: Coarse - only Aggregated, Blobs, Projects
@@ -248,11 +704,14 @@ class GraphEngine:
             subgraph = self.graph.subgraph(coarse_nodes)
             if len(subgraph.nodes) > 0:
                 pos = nx.spring_layout(subgraph, scale=500, center=(250, 250))
-                self.layouts[0] = {n: (float(p[0]), float(p[1])) for n, p in pos.items()}
+                self.layouts[0] = self._pack_layout(
+                    {n: (float(p[0]), float(p[1])) for n, p in pos.items()}
+                )
         
         # Level 1 and 2 use the full layout
-        self.layouts[1] = self.layouts.get(1, {})
-        self.layouts[2] = self.layouts.get(1, {})
+        empty = ({}, np.empty((0, 2), dtype=np.float32))
+        self.layouts[1] = self.layouts.get(1, empty)
+        self.layouts[2] = self.layouts.get(1, empty)
     
     # ============================================
     # Viewport and Zoom Operations
@@ -265,21 +724,46 @@ class GraphEngine:
         """
         zoom_level = request.zoom_level
         max_depth = min(request.max_depth, 3)  # Never exceed 3 levels
-        
+
+        # Sub-pixel pans produce the same response: quantize the box to
+        # a pan-step grid and serve recent identical queries from a
+        # short-TTL LRU. _version keys out anything computed before the
+        # last mutation.
+        grid = _VIEWPORT_CACHE_GRID
+        cache_key = (
+            self._version, zoom_level, max_depth, request.center_node_id,
+            round(request.center_x / grid), round(request.center_y / grid),
+            round(request.width / grid), round(request.height / grid),
+        )
+        cache = self._viewport_cache
+        cached = cache.get(cache_key)
+        if cached is not None:
+            stamp, data = cached
+            if time.monotonic() - stamp < _VIEWPORT_CACHE_TTL:
+                # Move to the fresh end of the LRU
+                del cache[cache_key]
+                cache[cache_key] = cached
+                return data
+            del cache[cache_key]
+
         visible_nodes = set()
         
         # Determine which node types are visible at this zoom level
         if zoom_level == 0:
             # Coarse: Only Aggregated, Blobs, Projects
-            type_filter = {NodeType.AGGREGATED, NodeType.BLOB, NodeType.PROJECT}
-            for node_type in type_filter:
-                visible_nodes.update(self.nodes_by_type[node_type])
+            visible_nodes = set().union(
+                self.nodes_by_type[NodeType.AGGREGATED],
+                self.nodes_by_type[NodeType.BLOB],
+                self.nodes_by_type[NodeType.PROJECT]
+            )
         
         elif zoom_level == 1:
             # Medium: Aggregated, Blobs, Projects + some Individuals if centered
-            type_filter = {NodeType.AGGREGATED, NodeType.BLOB, NodeType.PROJECT}
-            for node_type in type_filter:
-                visible_nodes.update(self.nodes_by_type[node_type])
+            visible_nodes = set().union(
+                self.nodes_by_type[NodeType.AGGREGATED],
+                self.nodes_by_type[NodeType.BLOB],
+                self.nodes_by_type[NodeType.PROJECT]
+            )
             
             # If centered on a node, add nearby individuals
             if request.center_node_id:
@@ -305,27 +789,17 @@ class GraphEngine:
                     visible_nodes = set(list(visible_nodes)[:2000])
         
         # Get edges between visible nodes
-        visible_edges = []
-        edge_set = set()
-        
-        for edge_id, edge in self.edge_data.items():
-            source, target = edge['source'], edge['target']
-            if source in visible_nodes and target in visible_nodes:
-                if (source, target) not in edge_set and (target, source) not in edge_set:
-                    visible_edges.append(edge)
-                    edge_set.add((source, target))
-        
-        # Prepare node data for response
-        nodes_data = []
-        for node_id in visible_nodes:
-            if node_id in self.node_data:
-                node = self.node_data[node_id].copy()
-                # Ensure position is set
-                if node_id in self.layouts.get(1, {}):
-                    node['x'], node['y'] = self.layouts[1][node_id]
-                nodes_data.append(node)
+        visible_edges = self.edges_between(visible_nodes)
+        
+        # Prepare node data for response. compute_layout already writes
+        # x,y back into node_data, so hand out the stored dicts directly
+        # instead of copying every visible node per frame; the response
+        # encoder serializes without mutating them.
+        node_data = self.node_data
+        nodes_data = [node_data[node_id] for node_id in visible_nodes
+                      if node_id in node_data]
         
-        return GraphData(
+        result = GraphData(
             nodes=nodes_data,
             edges=visible_edges,
             total_nodes=len(self.node_data),
@@ -333,42 +807,99 @@ class GraphEngine:
             viewport_nodes=len(visible_nodes),
             zoom_level=zoom_level
         )
+        while len(cache) >= _VIEWPORT_CACHE_SIZE:
+            del cache[next(iter(cache))]
+        cache[cache_key] = (time.monotonic(), result)
+        return result
     
     def _get_neighbors_bfs(self, center_id: str, max_depth: int = 3) -> Set[str]:
         """BFS traversal limited to max_depth levels"""
         if center_id not in self.graph:
             return set()
-        
-        visited = {center_id}
-        current_level = {center_id}
-        
-        for depth in range(max_depth):
-            next_level = set()
-            for node in current_level:
-                for neighbor in self.graph.neighbors(node):
-                    if neighbor not in visited:
-                        visited.add(neighbor)
-                        next_level.add(neighbor)
-            current_level = next_level
-            
-            if not current_level:
-                break
-        
-        return visited
+
+        # Large graphs take a compiled CSR path: the JIT BFS kernel
+        # when numba is present, else scipy's depth-limited dijkstra
+        if _csgraph is not None and self.graph.number_of_nodes() >= 2000:
+            csr, ids, idx = self._csr_adjacency()
+            if njit is not None:
+                visited = _bfs_depth_kernel(
+                    self._csr_indptr, self._csr_indices,
+                    idx[center_id], max_depth, len(ids)
+                )
+                return {ids[i] for i in np.flatnonzero(visited)}
+            dist = _csgraph.dijkstra(
+                csr, directed=False, unweighted=True,
+                indices=idx[center_id], limit=max_depth
+            )
+            return {ids[i] for i in np.flatnonzero(np.isfinite(dist))}
+
+        # NetworkX's cutoff-limited shortest-path walk runs the BFS
+        # loop in library code instead of per-neighbor Python sets
+        return set(nx.single_source_shortest_path_length(
+            self.graph, center_id, cutoff=max_depth
+        ))
+
+    def _csr_adjacency(self):
+        """Get the (csr, ids, id->idx) adjacency mirror, rebuilding if stale"""
+        if self._csr is None:
+            self._csr_ids = list(self.graph.nodes())
+            self._csr_idx = {nid: i for i, nid in enumerate(self._csr_ids)}
+            self._csr = nx.to_scipy_sparse_array(
+                self.graph, nodelist=self._csr_ids, weight=None, format='csr'
+            )
+            self._csr_indptr = self._csr.indptr.astype(np.int64)
+            self._csr_indices = self._csr.indices.astype(np.int64)
+        return self._csr, self._csr_ids, self._csr_idx
     
     def _get_nodes_in_bounds(self, min_x: float, max_x: float, 
                               min_y: float, max_y: float) -> Set[str]:
         """Get nodes within spatial bounds"""
-        result = set()
-        for node_id, node in self.node_data.items():
-            x, y = node.get('x', 0), node.get('y', 0)
-            if min_x <= x <= max_x and min_y <= y <= max_y:
-                result.add(node_id)
-        return result
+        if not self.node_data:
+            return set()
+
+        # Small graphs aren't worth a grid probe; one vectorized mask
+        # over the position arrays is cheaper than cell bookkeeping
+        if len(self.node_data) < 500:
+            ids, xy = self._position_arrays()
+            mask = ((xy[:, 0] >= min_x) & (xy[:, 0] <= max_x) &
+                    (xy[:, 1] >= min_y) & (xy[:, 1] <= max_y))
+            return set(ids[mask].tolist())
+
+        # Small viewports take the grid path: union the few covered
+        # cells and exact-filter their members. Large queries fall back
+        # to one vectorized mask over the position arrays.
+        grid, cell = self._grid_index()
+        cx0, cx1 = int(min_x // cell), int(max_x // cell)
+        cy0, cy1 = int(min_y // cell), int(max_y // cell)
+        n_cells = (cx1 - cx0 + 1) * (cy1 - cy0 + 1)
+        if 0 < n_cells <= len(grid):
+            result = set()
+            node_data = self.node_data
+            for cx in range(cx0, cx1 + 1):
+                for cy in range(cy0, cy1 + 1):
+                    for node_id in grid.get((cx, cy), ()):
+                        node = node_data.get(node_id)
+                        if node is None:
+                            continue
+                        x, y = node.get('x', 0.0), node.get('y', 0.0)
+                        if min_x <= x <= max_x and min_y <= y <= max_y:
+                            result.add(node_id)
+            return result
+
+        ids, xy = self._position_arrays()
+        mask = ((xy[:, 0] >= min_x) & (xy[:, 0] <= max_x) &
+                (xy[:, 1] >= min_y) & (xy[:, 1] <= max_y))
+        return set(ids[mask].tolist())
     
     # ============================================
     # Search Operations
     # ============================================
+
+    def _location_keys(self) -> List[str]:
+        """Sorted location keys, re-sorted when new locations appear"""
+        if len(self._loc_keys_sorted) != len(self.nodes_by_location):
+            self._loc_keys_sorted = sorted(self.nodes_by_location)
+        return self._loc_keys_sorted
     
     def search(
         self,
@@ -386,55 +917,101 @@ class GraphEngine:
         Search nodes with multiple criteria.
         Returns list of matching nodes.
         """
-        candidates = set(self.node_data.keys())
+        # Fast path for the dominant query shape: only type/skill
+        # filters set, answered straight from the posting sets with
+        # none of the generic per-node checks
+        if (query is None and availability is None and location is None
+                and sector is None and min_size is None and max_size is None):
+            return self._search_types_skills(node_types, skills, limit)
+
+        # Collect one candidate set per active index filter; the full
+        # id set is only materialized when no filter applies
+        filter_sets = []
         
         # Filter by node types
         if node_types:
+            nodes_by_type = self.nodes_by_type
             type_matches = set()
             for nt in node_types:
-                type_matches.update(self.nodes_by_type[nt])
-            candidates &= type_matches
+                type_matches.update(nodes_by_type[nt])
+            filter_sets.append(type_matches)
         
         # Filter by skills (OR logic - any skill matches)
         if skills:
+            nodes_by_skill = self.nodes_by_skill
             skill_matches = set()
             for skill in skills:
-                skill_matches.update(self.nodes_by_skill.get(skill.lower(), set()))
-            candidates &= skill_matches
+                skill_matches.update(nodes_by_skill.get(skill.lower(), set()))
+            filter_sets.append(skill_matches)
         
         # Filter by sector
         if sector:
-            candidates &= self.nodes_by_sector.get(sector.lower(), set())
+            filter_sets.append(self.nodes_by_sector.get(sector.lower(), set()))
         
-        # Filter by location
+        # Filter by location: bisect the sorted key list for the
+        # prefix range, then substring-scan only the remaining keys
         if location:
             location_matches = set()
             location_lower = location.lower()
-            for loc_key, node_ids in self.nodes_by_location.items():
+            keys = self._location_keys()
+            lo = bisect_left(keys, location_lower)
+            hi = bisect_left(keys, location_lower + '\uffff')
+            nodes_by_location = self.nodes_by_location
+            for loc_key in keys[lo:hi]:
+                location_matches.update(nodes_by_location[loc_key])
+            for loc_key in keys[:lo] + keys[hi:]:
                 if location_lower in loc_key:
-                    location_matches.update(node_ids)
-            candidates &= location_matches
-        
-        # Filter remaining criteria
+                    location_matches.update(nodes_by_location[loc_key])
+            filter_sets.append(location_matches)
+
+        # Intersect starting from the smallest set so the working set
+        # never exceeds the most selective filter
+        if filter_sets:
+            filter_sets.sort(key=len)
+            candidates = filter_sets[0].copy()
+            for s in filter_sets[1:]:
+                candidates &= s
+        else:
+            # Snapshot of the id set; the event loop may mutate
+            # node_data while this scan runs on a worker thread
+            candidates = set(self.node_data)
+        
+        # Text queries check the cached lowercase text. Candidates whose
+        # token postings cover every query token are visited first so a
+        # capped search can return before touching the long tail.
+        query_lower = query.lower() if query else None
+        if query_lower:
+            tokens = _TOKEN_RE.findall(query_lower)
+            if tokens:
+                token_index = self._token_index
+                hits = token_index.get(tokens[0], set())
+                for token in tokens[1:]:
+                    hits = hits & token_index.get(token, set())
+                likely = candidates & hits
+                ordered = list(likely)
+                ordered.extend(candidates - likely)
+                candidates = ordered
+
+        # Filter remaining criteria (locals hoisted out of the loop)
         results = []
+        append = results.append
+        search_text = self._search_text
+        node_data = self.node_data
+        individual_value = NodeType.INDIVIDUAL.value
         for node_id in candidates:
-            node = self.node_data[node_id]
+            # Tolerate nodes removed since the candidate snapshot
+            node = node_data.get(node_id)
+            if node is None:
+                continue
             
             # Text query search (name, description, bio)
-            if query:
-                query_lower = query.lower()
-                searchable = ' '.join([
-                    node.get('name', ''),
-                    node.get('description', ''),
-                    node.get('bio', ''),
-                    ' '.join(node.get('skills', []))
-                ]).lower()
-                if query_lower not in searchable:
+            if query_lower is not None:
+                if query_lower not in search_text.get(node_id, ''):
                     continue
             
             # Availability filter (for individuals)
             if availability is not None:
-                if node.get('node_type') == NodeType.INDIVIDUAL:
+                if node.get('node_type') == individual_value:
                     if node.get('availability') != availability:
                         continue
             
@@ -449,13 +1026,40 @@ class GraphEngine:
                 if size > max_size:
                     continue
             
-            results.append(node)
+            append(node)
             
             if len(results) >= limit:
                 break
         
         return results
     
+    def _search_types_skills(self, node_types, skills, limit: int) -> List[dict]:
+        """Specialized search for type and/or skill filters only"""
+        node_data = self.node_data
+        if node_types:
+            candidates = set()
+            for nt in node_types:
+                candidates |= self.nodes_by_type[nt]
+            if skills:
+                skill_matches = set()
+                for skill in skills:
+                    skill_matches.update(self.nodes_by_skill.get(skill.lower(), set()))
+                candidates &= skill_matches
+        elif skills:
+            candidates = set()
+            for skill in skills:
+                candidates |= self.nodes_by_skill.get(skill.lower(), set())
+        else:
+            # Snapshot: search runs on a worker thread while the event
+            # loop may be inserting or removing nodes
+            candidates = list(node_data)
+        results = []
+        for nid in islice(candidates, limit):
+            node = node_data.get(nid)
+            if node is not None:
+                results.append(node)
+        return results
+
     # ============================================
     # Discovery Operations
     # ============================================
@@ -476,45 +1080,131 @@ class GraphEngine:
         
         source_node = self.node_data[node_id]
         
-        # BFS to find related nodes
-        visited = {node_id}
-        queue = [(node_id, [node_id])]
+        # Pre-resolve the allowed edge-type values; edge_type is stored
+        # as the enum's string value
+        allowed_types = None
+        if relationship_types:
+            allowed_types = {et.value for et in relationship_types}
+
+        # Unfiltered wide discoveries visit whole levels anyway, so take
+        # the gather-based CSR path where the frontier expands as array
+        # ops instead of per-node dict probes
+        if (allowed_types is None and limit >= 256
+                and self.graph.number_of_nodes() >= 2000):
+            return self._discover_csr(node_id, max_depth, limit)
+
+        # BFS with a deque and parent pointers; paths are materialized
+        # only for the nodes actually returned
+        parent = {node_id: None}
+        queue = deque([(node_id, 0)])
         related = []
         paths = []
+        edge_data = self.edge_data
+        adj = self.graph.adj
         
         while queue and len(related) < limit:
-            current_id, path = queue.pop(0)
+            current_id, depth = queue.popleft()
             
-            if len(path) > max_depth + 1:
+            if depth > max_depth:
                 continue
             
-            for neighbor_id in self.graph.neighbors(current_id):
-                if neighbor_id in visited:
+            for neighbor_id, attrs in adj[current_id].items():
+                if neighbor_id in parent:
                     continue
                 
-                # Check relationship type filter
-                if relationship_types:
-                    edge_match = False
-                    for edge in self.edge_data.values():
-                        if ((edge['source'] == current_id and edge['target'] == neighbor_id) or
-                            (edge['source'] == neighbor_id and edge['target'] == current_id)):
-                            if EdgeType(edge['edge_type']) in relationship_types:
-                                edge_match = True
-                                break
-                    if not edge_match:
+                # Check relationship type filter via the edge_id stored
+                # on the adjacency (O(1) instead of scanning edge_data)
+                if allowed_types is not None:
+                    edge = edge_data.get(attrs.get('edge_id'))
+                    if edge is None or edge['edge_type'] not in allowed_types:
                         continue
                 
-                visited.add(neighbor_id)
-                new_path = path + [neighbor_id]
+                parent[neighbor_id] = current_id
                 
                 if neighbor_id in self.node_data:
                     related.append(self.node_data[neighbor_id])
-                    paths.append(new_path)
+                    path = [neighbor_id]
+                    walk = current_id
+                    while walk is not None:
+                        path.append(walk)
+                        walk = parent[walk]
+                    path.reverse()
+                    paths.append(path)
                 
-                queue.append((neighbor_id, new_path))
+                queue.append((neighbor_id, depth + 1))
         
         return source_node, related[:limit], paths[:limit]
     
+    def _discover_csr(
+        self,
+        node_id: str,
+        max_depth: int,
+        limit: int
+    ) -> Tuple[Optional[dict], List[dict], List[List[str]]]:
+        """
+        Level-synchronous discovery over the CSR mirror. Each level
+        gathers every frontier node's neighbor range in one vectorized
+        pass (repeat + cumsum indexing), dedupes with np.unique, and
+        keeps the first-seen source as the BFS parent for paths.
+        """
+        csr, ids, idx = self._csr_adjacency()
+        indptr = self._csr_indptr
+        indices = self._csr_indices
+        n = len(ids)
+        start = idx[node_id]
+
+        parent = np.full(n, -1, dtype=np.int64)
+        parent[start] = start
+        frontier = np.array([start], dtype=np.int64)
+        discovered: List[np.ndarray] = []
+        total = 0
+
+        # The deque path discovers the neighbors of depth-max_depth
+        # nodes as well (expansion stops, discovery does not), so run
+        # max_depth + 1 gather rounds to keep the same reach
+        for _ in range(max_depth + 1):
+            counts = indptr[frontier + 1] - indptr[frontier]
+            n_out = int(counts.sum())
+            if n_out == 0:
+                break
+            # Flat gather of all neighbor slices without a Python loop
+            starts = np.repeat(indptr[frontier], counts)
+            offsets = (np.arange(n_out, dtype=np.int64)
+                       - np.repeat(np.cumsum(counts) - counts, counts))
+            neigh = indices[starts + offsets]
+            srcs = np.repeat(frontier, counts)
+
+            unseen = parent[neigh] < 0
+            cand = neigh[unseen]
+            cand_src = srcs[unseen]
+            if cand.size == 0:
+                break
+            uniq, first = np.unique(cand, return_index=True)
+            parent[uniq] = cand_src[first]
+            discovered.append(uniq)
+            frontier = uniq
+            total += uniq.size
+            if total >= limit:
+                break
+
+        node_data = self.node_data
+        related: List[dict] = []
+        paths: List[List[str]] = []
+        for level in discovered:
+            for i in level:
+                related.append(node_data[ids[i]])
+                path = []
+                walk = int(i)
+                while parent[walk] != walk:
+                    path.append(ids[walk])
+                    walk = int(parent[walk])
+                path.append(ids[walk])
+                path.reverse()
+                paths.append(path)
+                if len(related) >= limit:
+                    return node_data[node_id], related, paths
+        return node_data[node_id], related, paths
+
     def get_similar_nodes(self, node_id: str, limit: int = 10) -> List[dict]:
         """Find nodes similar to the given node based on attributes"""
         if node_id not in self.node_data:
@@ -522,37 +1212,41 @@ class GraphEngine:
         
         source = self.node_data[node_id]
         source_type = source.get('node_type')
-        source_skills = set(source.get('skills', []))
-        source_sector = source.get('sector', '').lower()
-        
+        source_skills = self._skills_by_node.get(node_id, frozenset())
+
+        # Resolve sector/location bonuses to membership tests against
+        # the existing indices instead of per-candidate string compares
+        sector = source.get('sector')
+        sector_peers = self.nodes_by_sector.get(sector.lower(), set()) if sector else set()
+        loc = source.get('location')
+        location_peers = self.nodes_by_location.get(loc.lower(), set()) if loc else set()
+
+        skills_by_node = self._skills_by_node
+        node_data = self.node_data
         scored = []
-        
-        for nid, node in self.node_data.items():
+
+        # Only same-type nodes can score, so restrict the pool up front
+        for nid in self.nodes_by_type[_NT.get(source_type)]:
             if nid == node_id:
                 continue
             
-            # Same type gets base score
-            if node.get('node_type') != source_type:
-                continue
-            
             score = 0.0
             
-            # Skill overlap
-            node_skills = set(node.get('skills', []))
+            # Skill overlap via cached frozensets
+            node_skills = skills_by_node.get(nid)
             if source_skills and node_skills:
-                overlap = len(source_skills & node_skills)
-                score += overlap * 2.0
+                score += len(source_skills & node_skills) * 2.0
             
             # Same sector
-            if source_sector and node.get('sector', '').lower() == source_sector:
+            if nid in sector_peers:
                 score += 3.0
             
             # Same location
-            if source.get('location') and source.get('location') == node.get('location'):
+            if nid in location_peers:
                 score += 1.0
             
             if score > 0:
-                scored.append((score, node))
+                scored.append((score, node_data[nid]))
         
         # Sort by score descending
         scored.sort(key=lambda x: -x[0])
@@ -584,16 +1278,30 @@ class GraphEngine:
         return {
             'nodes': list(self.node_data.values()),
             'edges': list(self.edge_data.values()),
-            'layouts': {k: {nid: list(pos) for nid, pos in v.items()} 
-                       for k, v in self.layouts.items()},
+            # String zoom keys: orjson rejects int dict keys and
+            # stdlib json would coerce them anyway; from_dict converts
+            # back with int()
+            'layouts': {str(k): {nid: [float(xy[i, 0]), float(xy[i, 1])]
+                                 for nid, i in idx.items()}
+                        for k, (idx, xy) in self.layouts.items()},
             'bounds': self.bounds
         }
     
+    def to_json(self) -> bytes:
+        """Serialize graph straight to JSON bytes.
+        Uses orjson when installed, which encodes several times faster
+        than stdlib json and understands numpy scalars."""
+        data = self.to_dict()
+        if orjson is not None:
+            return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
+        return json.dumps(data).encode()
+
     def from_dict(self, data: dict):
         """Load graph from dictionary"""
         self.graph.clear()
         self.node_data.clear()
         self.edge_data.clear()
+        self._edges_by_pair.clear()
         self.nodes_by_type.clear()
         self.nodes_by_skill.clear()
         self.nodes_by_sector.clear()
@@ -610,7 +1318,9 @@ class GraphEngine:
         # Load layouts
         if 'layouts' in data:
             self.layouts = {
-                int(k): {nid: tuple(pos) for nid, pos in v.items()}
+                int(k): self._pack_layout(
+                    {nid: tuple(pos) for nid, pos in v.items()}
+                )
                 for k, v in data['layouts'].items()
             }
         
@@ -3,17 +3,39 @@ Blobs Platform - Main FastAPI Application
 Provides REST API and WebSocket endpoints for graph operations
 """
 import asyncio
+import hashlib
 import json
+import os
+import random
 import time
+import zlib
 import logging
-from typing import List, Optional
+from datetime import datetime
+from typing import Dict, List, Optional
 from contextlib import asynccontextmanager
+from functools import lru_cache
 
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, Query
+from pydantic import TypeAdapter
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 import uvicorn
 
+try:
+    # Optional: cross-worker broadcast bridge, used when REDIS_URL is set
+    import redis.asyncio as aioredis
+except ImportError:
+    aioredis = None
+
+try:
+    # Optional: orjson-backed responses encode large graph payloads
+    # several times faster than the stdlib encoder
+    import orjson
+    from fastapi.responses import ORJSONResponse as DefaultResponse
+except ImportError:
+    orjson = None
+    DefaultResponse = JSONResponse
+
 from models import (
     NodeType, EdgeType, BlobType, ProjectStatus, ProjectType,
     IndividualCreate, BlobCreate, AggregatedCreate, ProjectCreate,
@@ -23,6 +45,10 @@ from models import (
 from graph_engine import GraphEngine
 from data_generator import generate_test_data
 
+# Hoisted validator for the websocket viewport hot path; TypeAdapter
+# reuses the compiled core schema instead of re-entering model __init__
+_viewport_adapter = TypeAdapter(ViewportRequest)
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -30,27 +56,184 @@ logger = logging.getLogger(__name__)
 # Global graph engine instance
 graph_engine = GraphEngine()
 
+# Outbound queue bound per client and the burst size coalesced into a
+# single frame by the writer task
+OUTBOUND_QUEUE_SIZE = 256
+COALESCE_MAX = 32
+
+# Pub/sub channel for fanning broadcasts across uvicorn workers
+BROADCAST_CHANNEL = "graph-events"
+
+# Frames above this size are zlib-compressed once and sent as binary;
+# per-message deflate is disabled so fan-out doesn't recompress the
+# same payload per socket
+COMPRESS_MIN_BYTES = 4096
+
+
+def _new_id() -> str:
+    """Random 128-bit hex id; cheaper than uuid4 object construction"""
+    return os.urandom(16).hex()
+
+
+# Placement jitter for newly created nodes. A dedicated Random avoids
+# re-hashing the node id (which also made x and y identical).
+_rng = random.Random()
+
+
+def _jitter() -> int:
+    return _rng.randrange(-50, 51)
+
+
+@lru_cache(maxsize=4)
+def _iso_for_second(second: int) -> str:
+    return datetime.utcfromtimestamp(second).isoformat()
+
+
+def _utcnow_iso() -> str:
+    """Second-granularity UTC timestamp; burst creations share the
+    same cached string instead of formatting a datetime each"""
+    return _iso_for_second(int(time.time()))
+
+
+def _encode_message(message: dict) -> str:
+    """Serialize a websocket message once per frame"""
+    if orjson is not None:
+        return orjson.dumps(message).decode()
+    return json.dumps(message)
+
+
+# Digest-keyed LRU of compressed frames: fan-out of the same frame
+# reuses the bytes without pinning the (multi-MB) uncompressed strings
+# the way an lru_cache keyed on the text would
+_COMPRESS_CACHE_SIZE = 64
+_compress_cache: Dict[bytes, bytes] = {}
+
+
+def _compress_frame(text: str) -> bytes:
+    """Compress a large frame once; identical frames fanned out to many
+    clients reuse the cached bytes"""
+    raw = text.encode()
+    key = hashlib.sha1(raw).digest()
+    cached = _compress_cache.pop(key, None)
+    if cached is None:
+        cached = zlib.compress(raw, 1)
+        while len(_compress_cache) >= _COMPRESS_CACHE_SIZE:
+            del _compress_cache[next(iter(_compress_cache))]
+    _compress_cache[key] = cached
+    return cached
+
+
+async def _send_frame(websocket: WebSocket, text: str):
+    """Send a frame, as compressed binary when it is large"""
+    if len(text) > COMPRESS_MIN_BYTES:
+        await websocket.send_bytes(_compress_frame(text))
+    else:
+        await websocket.send_text(text)
+
+
 # WebSocket connection manager
 class ConnectionManager:
     def __init__(self):
         self.active_connections: List[WebSocket] = []
+        self._queues: Dict[WebSocket, asyncio.Queue] = {}
+        self._writers: Dict[WebSocket, asyncio.Task] = {}
+        # Redis pub/sub bridge; populated by start_bridge when
+        # REDIS_URL is set and the redis package is installed
+        self._redis = None
+        self._pubsub_task: Optional[asyncio.Task] = None
+
+    async def start_bridge(self, redis_url: str):
+        """Route broadcasts through Redis so every worker's clients see
+        events originated on any worker."""
+        if aioredis is None:
+            logger.warning("REDIS_URL set but the redis package is not "
+                           "installed; broadcasts stay process-local")
+            return
+        self._redis = aioredis.from_url(redis_url)
+        pubsub = self._redis.pubsub()
+        await pubsub.subscribe(BROADCAST_CHANNEL)
+        self._pubsub_task = asyncio.create_task(self._relay(pubsub))
+        logger.info("Redis broadcast bridge connected (%s)", redis_url)
+
+    async def stop_bridge(self):
+        if self._pubsub_task is not None:
+            self._pubsub_task.cancel()
+            self._pubsub_task = None
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+
+    async def _relay(self, pubsub):
+        """Re-fan messages published by any worker to local sockets"""
+        try:
+            async for item in pubsub.listen():
+                if item.get('type') != 'message':
+                    continue
+                self._local_broadcast(json.loads(item['data']))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error("Redis bridge error: %s", e)
     
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
         self.active_connections.append(websocket)
-        logger.info(f"WebSocket connected. Total connections: {len(self.active_connections)}")
+        # Each client gets a bounded outbound queue drained by its own
+        # writer task, so producers never block on a slow consumer
+        queue = asyncio.Queue(maxsize=OUTBOUND_QUEUE_SIZE)
+        self._queues[websocket] = queue
+        self._writers[websocket] = asyncio.create_task(self._drain(websocket, queue))
+        logger.info("WebSocket connected. Total connections: %d", len(self.active_connections))
     
     def disconnect(self, websocket: WebSocket):
-        self.active_connections.remove(websocket)
-        logger.info(f"WebSocket disconnected. Total connections: {len(self.active_connections)}")
+        if websocket in self.active_connections:
+            self.active_connections.remove(websocket)
+        self._queues.pop(websocket, None)
+        writer = self._writers.pop(websocket, None)
+        if writer is not None:
+            writer.cancel()
+        logger.info("WebSocket disconnected. Total connections: %d", len(self.active_connections))
+    
+    async def _drain(self, websocket: WebSocket, queue: asyncio.Queue):
+        """Writer loop: send queued events, coalescing bursts into one frame"""
+        try:
+            while True:
+                events = [await queue.get()]
+                while len(events) < COALESCE_MAX:
+                    try:
+                        events.append(queue.get_nowait())
+                    except asyncio.QueueEmpty:
+                        break
+                if len(events) == 1:
+                    text = _encode_message(events[0])
+                else:
+                    text = _encode_message({'type': 'batch', 'events': events})
+                await _send_frame(websocket, text)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error("WebSocket writer error: %s", e)
+            self.disconnect(websocket)
     
     async def broadcast(self, message: dict):
-        """Broadcast message to all connected clients"""
-        for connection in self.active_connections:
+        """Broadcast a message to all clients, on every worker when the
+        Redis bridge is up (the publish loops back to this worker too)."""
+        if self._redis is not None:
+            await self._redis.publish(BROADCAST_CHANNEL,
+                                      _encode_message(message))
+            return
+        self._local_broadcast(message)
+
+    def _local_broadcast(self, message: dict):
+        """Fan a message out to this process's connections"""
+        for connection in list(self.active_connections):
+            queue = self._queues.get(connection)
+            if queue is None:
+                continue
             try:
-                await connection.send_json(message)
-            except Exception as e:
-                logger.error(f"Error broadcasting: {e}")
+                queue.put_nowait(message)
+            except asyncio.QueueFull:
+                logger.warning("Outbound queue full; dropping broadcast for slow client")
 
 manager = ConnectionManager()
 
@@ -62,19 +245,24 @@ async def lifespan(app: FastAPI):
     # Use fewer nodes in production for faster startup (can be increased later)
     num_individuals = int(os.getenv("NUM_INDIVIDUALS", "1000"))
     logger.info("Starting Blobs Platform...")
-    logger.info(f"Generating test data ({num_individuals} individuals)...")
+    logger.info("Generating test data (%d individuals)...", num_individuals)
     
     start_time = time.time()
     generate_test_data(graph_engine, num_individuals=num_individuals)
     elapsed = time.time() - start_time
     
-    logger.info(f"Test data generated in {elapsed:.2f}s")
+    logger.info("Test data generated in %.2fs", elapsed)
     stats = graph_engine.get_stats()
-    logger.info(f"Graph stats: {stats}")
+    logger.info("Graph stats: %s", stats)
+
+    redis_url = os.getenv("REDIS_URL")
+    if redis_url:
+        await manager.start_bridge(redis_url)
     
     yield
     
     # Shutdown
+    await manager.stop_bridge()
     logger.info("Shutting down Blobs Platform...")
 
 
@@ -83,12 +271,12 @@ app = FastAPI(
     title="Blobs Platform API",
     description="Professional Networking Graph Platform",
     version="0.1.0-alpha",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=DefaultResponse
 )
 
 # CORS middleware for frontend
 # Get allowed origins from environment or allow all for development
-import os
 CORS_ORIGINS = os.getenv("CORS_ORIGINS", "*").split(",")
 
 app.add_middleware(
@@ -126,13 +314,28 @@ async def get_bounds():
 # Node CRUD Operations
 # --------------------------------------------
 
+async def _create_node(node_data: dict, message: str) -> NodeCreateResponse:
+    """Shared tail of the create handlers: insert, broadcast, respond.
+
+    The per-type dict literals stay inline in each endpoint so every
+    key is a constant at that call site; only the common machinery
+    lives here.
+    """
+    graph_engine.add_node(node_data)
+
+    # Broadcast to WebSocket clients
+    await manager.broadcast({
+        'type': 'node_created',
+        'node': node_data
+    })
+
+    return NodeCreateResponse(success=True, node=node_data, message=message)
+
+
 @app.post("/api/nodes/individual", response_model=NodeCreateResponse)
 async def create_individual(data: IndividualCreate):
     """Create a new Individual node"""
-    import uuid
-    from datetime import datetime
-    
-    node_id = str(uuid.uuid4())
+    node_id = _new_id()
     node_data = {
         'id': node_id,
         'name': data.name,
@@ -144,29 +347,17 @@ async def create_individual(data: IndividualCreate):
         'sector': data.sector,
         'bio': data.bio,
         'blob_memberships': [],
-        'created_at': datetime.utcnow().isoformat(),
-        'x': graph_engine.bounds['max_x'] / 2 + (hash(node_id) % 100 - 50),
-        'y': graph_engine.bounds['max_y'] / 2 + (hash(node_id) % 100 - 50)
+        'created_at': _utcnow_iso(),
+        'x': graph_engine.bounds['max_x'] / 2 + _jitter(),
+        'y': graph_engine.bounds['max_y'] / 2 + _jitter()
     }
-    
-    graph_engine.add_node(node_data)
-    
-    # Broadcast to WebSocket clients
-    await manager.broadcast({
-        'type': 'node_created',
-        'node': node_data
-    })
-    
-    return NodeCreateResponse(success=True, node=node_data, message="Individual created")
+    return await _create_node(node_data, "Individual created")
 
 
 @app.post("/api/nodes/blob", response_model=NodeCreateResponse)
 async def create_blob(data: BlobCreate):
     """Create a new Blob node"""
-    import uuid
-    from datetime import datetime
-    
-    node_id = str(uuid.uuid4())
+    node_id = _new_id()
     node_data = {
         'id': node_id,
         'name': data.name,
@@ -177,28 +368,17 @@ async def create_blob(data: BlobCreate):
         'location': data.location,
         'member_count': 0,
         'parent_aggregated_id': data.parent_aggregated_id,
-        'created_at': datetime.utcnow().isoformat(),
-        'x': graph_engine.bounds['max_x'] / 2 + (hash(node_id) % 100 - 50),
-        'y': graph_engine.bounds['max_y'] / 2 + (hash(node_id) % 100 - 50)
+        'created_at': _utcnow_iso(),
+        'x': graph_engine.bounds['max_x'] / 2 + _jitter(),
+        'y': graph_engine.bounds['max_y'] / 2 + _jitter()
     }
-    
-    graph_engine.add_node(node_data)
-    
-    await manager.broadcast({
-        'type': 'node_created',
-        'node': node_data
-    })
-    
-    return NodeCreateResponse(success=True, node=node_data, message="Blob created")
+    return await _create_node(node_data, "Blob created")
 
 
 @app.post("/api/nodes/project", response_model=NodeCreateResponse)
 async def create_project(data: ProjectCreate):
     """Create a new Project node"""
-    import uuid
-    from datetime import datetime
-    
-    node_id = str(uuid.uuid4())
+    node_id = _new_id()
     node_data = {
         'id': node_id,
         'name': data.name,
@@ -211,19 +391,11 @@ async def create_project(data: ProjectCreate):
         'location': data.location,
         'assigned_blob_ids': [],
         'assigned_individual_ids': [],
-        'created_at': datetime.utcnow().isoformat(),
-        'x': graph_engine.bounds['max_x'] / 2 + (hash(node_id) % 100 - 50),
-        'y': graph_engine.bounds['max_y'] / 2 + (hash(node_id) % 100 - 50)
+        'created_at': _utcnow_iso(),
+        'x': graph_engine.bounds['max_x'] / 2 + _jitter(),
+        'y': graph_engine.bounds['max_y'] / 2 + _jitter()
     }
-    
-    graph_engine.add_node(node_data)
-    
-    await manager.broadcast({
-        'type': 'node_created',
-        'node': node_data
-    })
-    
-    return NodeCreateResponse(success=True, node=node_data, message="Project created")
+    return await _create_node(node_data, "Project created")
 
 
 @app.get("/api/nodes/{node_id}")
@@ -262,9 +434,6 @@ async def delete_node(node_id: str):
 @app.post("/api/edges")
 async def create_edge(data: EdgeCreate):
     """Create an edge between two nodes"""
-    import uuid
-    from datetime import datetime
-    
     # Verify both nodes exist
     if not graph_engine.get_node(data.source):
         raise HTTPException(status_code=404, detail="Source node not found")
@@ -272,12 +441,12 @@ async def create_edge(data: EdgeCreate):
         raise HTTPException(status_code=404, detail="Target node not found")
     
     edge_data = {
-        'id': str(uuid.uuid4()),
+        'id': _new_id(),
         'source': data.source,
         'target': data.target,
         'edge_type': data.edge_type.value,
         'weight': data.weight,
-        'created_at': datetime.utcnow().isoformat()
+        'created_at': _utcnow_iso()
     }
     
     graph_engine.add_edge(edge_data)
@@ -305,7 +474,8 @@ async def get_viewport_graph(request: ViewportRequest):
     graph_data = graph_engine.get_viewport_graph(request)
     
     elapsed_ms = (time.time() - start_time) * 1000
-    logger.info(f"Viewport query: {graph_data.viewport_nodes} nodes in {elapsed_ms:.2f}ms")
+    logger.info("Viewport query: %d nodes in %.2fms",
+                graph_data.viewport_nodes, elapsed_ms)
     
     return {
         **graph_data.model_dump(),
@@ -338,19 +508,21 @@ async def get_full_graph(
         for node_id, node in list(graph_engine.node_data.items())[:limit]:
             nodes.append(node)
     
-    # Get edges for these nodes
+    # Get edges for these nodes via the adjacency instead of scanning
+    # the whole edge table
     node_ids = {n['id'] for n in nodes}
-    edges = []
-    for edge in graph_engine.edge_data.values():
-        if edge['source'] in node_ids and edge['target'] in node_ids:
-            edges.append(edge)
+    edges = graph_engine.edges_between(node_ids)
     
     elapsed_ms = (time.time() - start_time) * 1000
     
-    # Debug logging
+    # Debug logging; guard the sample-node lookups so they cost
+    # nothing when INFO is disabled
     if nodes:
-        sample_node = nodes[0]
-        logger.info(f"Returning {len(nodes)} nodes, {len(edges)} edges. Sample node: {sample_node.get('name')} at ({sample_node.get('x')}, {sample_node.get('y')})")
+        if logger.isEnabledFor(logging.INFO):
+            sample_node = nodes[0]
+            logger.info("Returning %d nodes, %d edges. Sample node: %s at (%s, %s)",
+                        len(nodes), len(edges), sample_node.get('name'),
+                        sample_node.get('x'), sample_node.get('y'))
     else:
         logger.warning("No nodes to return!")
     
@@ -379,7 +551,10 @@ async def search_nodes(request: SearchRequest):
     """
     start_time = time.time()
     
-    results = graph_engine.search(
+    # Run the scan off the event loop so long searches don't starve
+    # websocket traffic
+    results = await asyncio.to_thread(
+        graph_engine.search,
         query=request.query,
         node_types=request.node_types,
         skills=request.skills,
@@ -408,7 +583,7 @@ async def quick_search(
     """Quick text search across all nodes"""
     start_time = time.time()
     
-    results = graph_engine.search(query=q, limit=limit)
+    results = await asyncio.to_thread(graph_engine.search, query=q, limit=limit)
     
     elapsed_ms = (time.time() - start_time) * 1000
     
@@ -501,13 +676,13 @@ async def websocket_graph(websocket: WebSocket):
             
             if message_type == 'viewport':
                 # Client is requesting viewport update
-                request = ViewportRequest(**data.get('payload', {}))
+                request = _viewport_adapter.validate_python(data.get('payload') or {})
                 graph_data = graph_engine.get_viewport_graph(request)
                 
-                await websocket.send_json({
+                await _send_frame(websocket, _encode_message({
                     'type': 'viewport_data',
                     'payload': graph_data.model_dump()
-                })
+                }))
             
             elif message_type == 'focus_node':
                 # Client wants to focus on a specific node
@@ -516,32 +691,33 @@ async def websocket_graph(websocket: WebSocket):
                 
                 if node_id in graph_engine.node_data:
                     node = graph_engine.node_data[node_id]
-                    neighbor_ids = graph_engine._get_neighbors_bfs(node_id, max_depth=depth)
+                    # One BFS pass yields both the neighborhood and its
+                    # internal edges
+                    neighbor_ids, edges = graph_engine.focus_subgraph(
+                        node_id, max_depth=depth)
                     
                     nodes = [graph_engine.node_data[nid] for nid in neighbor_ids]
                     
-                    # Get edges
-                    edges = []
-                    for edge in graph_engine.edge_data.values():
-                        if edge['source'] in neighbor_ids and edge['target'] in neighbor_ids:
-                            edges.append(edge)
-                    
-                    await websocket.send_json({
+                    await _send_frame(websocket, _encode_message({
                         'type': 'focus_data',
                         'payload': {
                             'center_node': node,
                             'nodes': nodes,
                             'edges': edges
                         }
-                    })
+                    }))
             
             elif message_type == 'ping':
-                await websocket.send_json({'type': 'pong'})
+                await websocket.send_text(_encode_message({'type': 'pong'}))
     
     except WebSocketDisconnect:
-        manager.disconnect(websocket)
+        # Normal client exit, not an error
+        pass
     except Exception as e:
-        logger.error(f"WebSocket error: {e}")
+        logger.error("WebSocket error: %s", e)
+    finally:
+        # Always drop the connection and cancel its writer task, even
+        # if a send was in flight when the handler unwound
         manager.disconnect(websocket)
 
 
@@ -551,10 +727,29 @@ async def websocket_graph(websocket: WebSocket):
 
 if __name__ == "__main__":
     port = int(os.getenv("PORT", 8000))
+    # uvloop/httptools replace the selector loop and HTTP parser with
+    # C implementations; each falls back independently when missing
+    try:
+        import uvloop  # noqa: F401
+        loop_impl = "uvloop"
+    except ImportError:
+        loop_impl = "auto"
+    try:
+        import httptools  # noqa: F401
+        http_impl = "httptools"
+    except ImportError:
+        http_impl = "auto"
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
         port=port,
         reload=os.getenv("ENV", "development") == "development",
-        log_level="info"
+        log_level="info",
+        loop=loop_impl,
+        http=http_impl,
+        ws="websockets",
+        # Large frames are compressed once at the application layer, so
+        # skip per-socket deflate during fan-out
+        ws_per_message_deflate=False,
+        workers=int(os.getenv("WEB_CONCURRENCY", "1"))
     )
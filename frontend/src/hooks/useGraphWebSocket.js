@@ -31,6 +31,8 @@ export function useGraphWebSocket(onMessage) {
       console.log('Connecting to WebSocket:', wsUrl);
       
       const ws = new WebSocket(wsUrl);
+      // The server sends frames above ~4KB as zlib-compressed binary
+      ws.binaryType = 'arraybuffer';
       wsRef.current = ws;
 
       ws.onopen = () => {
@@ -40,17 +42,41 @@ export function useGraphWebSocket(onMessage) {
         reconnectAttempts.current = 0;
       };
 
-      ws.onmessage = (event) => {
-        try {
-          const data = JSON.parse(event.data);
-          if (onMessage) {
+      const dispatch = (data) => {
+        if (onMessage) {
+          // The server coalesces bursts of updates into batch frames
+          if (data.type === 'batch' && Array.isArray(data.events)) {
+            data.events.forEach(onMessage);
+          } else {
             onMessage(data);
           }
-        } catch (e) {
-          console.error('Error parsing WebSocket message:', e);
         }
       };
 
+      const inflate = async (buffer) => {
+        // zlib stream -> text via the native DecompressionStream
+        const stream = new Blob([buffer])
+          .stream()
+          .pipeThrough(new DecompressionStream('deflate'));
+        return new Response(stream).text();
+      };
+
+      // Chain frame handling so messages dispatch in arrival order
+      // even when a binary frame has to await async inflation
+      let pending = Promise.resolve();
+      ws.onmessage = (event) => {
+        pending = pending
+          .then(async () => {
+            const text = event.data instanceof ArrayBuffer
+              ? await inflate(event.data)
+              : event.data;
+            dispatch(JSON.parse(text));
+          })
+          .catch((e) => {
+            console.error('Error parsing WebSocket message:', e);
+          });
+      };
+
       ws.onerror = (event) => {
         console.error('WebSocket error:', event);
         setError('Connection error');